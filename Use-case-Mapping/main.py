@@ -78,6 +78,8 @@ async def main():
         
         # Load configuration
         config = load_config()
+        if getattr(args, 'no_cache', False):
+            config['enable_cache'] = False
         
         # Handle interactive mode
         if getattr(args, 'interactive', False):
@@ -9,6 +9,10 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 
+# Accepted values for the 'log_level' setting
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR'})
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from environment variables and config files.
@@ -38,6 +42,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         'max_tokens': int(os.getenv('DEFAULT_MAX_TOKENS', 1000)),
         'temperature': float(os.getenv('DEFAULT_TEMPERATURE', 0.7)),
         'timeout': int(os.getenv('REQUEST_TIMEOUT', 30)),
+        'max_parallel_requests': int(os.getenv('THREAD_POOL_SIZE', (os.cpu_count() or 1) * 5)),
         
         # Logging
         'log_level': os.getenv('LOG_LEVEL', 'INFO'),
@@ -50,10 +55,13 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         # Caching
         'enable_cache': True,
         'cache_duration': 3600,  # 1 hour
+        'cache_policy': os.getenv('CACHE_POLICY', 'enabled'),
+        'cache_file': os.getenv('CACHE_FILE', 'response_cache.db'),
         
         # Rate Limiting
         'rate_limit_per_minute': 60,
         'rate_limit_per_hour': 1000,
+        'rate_limit_tokens_per_minute': int(os.getenv('RATE_LIMIT_TPM', 90000)),
     }
     
     # Load from YAML config file if provided
@@ -220,9 +228,8 @@ def validate_config(config: Dict[str, Any]) -> list[str]:
         issues.append("Error: timeout must be greater than 0")
     
     # Check log level
-    valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
-    if config.get('log_level', 'INFO').upper() not in valid_log_levels:
-        issues.append(f"Warning: Invalid log level. Must be one of: {valid_log_levels}")
+    if config.get('log_level', 'INFO').upper() not in _VALID_LOG_LEVELS:
+        issues.append(f"Warning: Invalid log level. Must be one of: {sorted(_VALID_LOG_LEVELS)}")
     
     return issues
 
@@ -5,7 +5,80 @@ Base provider class and interfaces for model providers.
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from functools import lru_cache, wraps
+import asyncio
+import importlib.util
+import json
+from types import MappingProxyType
 import time
+from .rate_limiter import AsyncTokenBucket
+from .response_cache import ResponseCache
+
+
+@lru_cache(maxsize=None)
+def is_module_available(module_name: str) -> bool:
+    """Check once per process whether an optional dependency can be imported."""
+    return importlib.util.find_spec(module_name) is not None
+
+
+def copy_characteristics(characteristics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a shared characteristics table entry for one caller.
+    
+    The module-level tables are only read-only at the top level, so the entry
+    and its list values are copied to keep a caller's edits from leaking into
+    later responses.
+    """
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in characteristics.items()
+    }
+
+
+_DEFAULT_CONTEXT_WINDOWS = MappingProxyType({
+    'gpt-3.5-turbo': 4096,
+    'gpt-4': 8192,
+    'gpt-4-turbo': 128000,
+    'claude-3-haiku': 200000,
+    'claude-3-sonnet': 200000,
+    'claude-3-opus': 200000,
+})
+
+
+def singleflight(method):
+    """
+    Share one in-flight call between concurrent identical generate_response calls.
+    
+    Callers that arrive while a request with the same arguments is still running
+    await its result instead of issuing a duplicate API call.
+    """
+    @wraps(method)
+    async def wrapper(self, query: str, model_type: str = 'instruct', model_name: Optional[str] = None, **kwargs):
+        key = (query, model_type, model_name, json.dumps(kwargs, sort_keys=True, default=str))
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shield so a cancelled follower doesn't cancel the shared call
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await method(self, query, model_type, model_name, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when there are no followers
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+    
+    return wrapper
 
 
 @dataclass
@@ -25,9 +98,17 @@ class ModelResponse:
 class BaseProvider(ABC):
     """Abstract base class for model providers."""
     
+    __slots__ = ('config', 'provider_name', 'response_cache', 'rate_limiter', '_inflight')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.provider_name = self.__class__.__name__.lower().replace('provider', '')
+        self.response_cache = ResponseCache.from_config(config)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.rate_limiter = AsyncTokenBucket(
+            rpm=config.get('rate_limit_per_minute'),
+            tpm=config.get('rate_limit_tokens_per_minute')
+        )
     
     @abstractmethod
     async def generate_response(
@@ -142,15 +223,7 @@ class BaseProvider(ABC):
             Context window size in tokens
         """
         # Default context window sizes (should be overridden)
-        default_windows = {
-            'gpt-3.5-turbo': 4096,
-            'gpt-4': 8192,
-            'gpt-4-turbo': 128000,
-            'claude-3-haiku': 200000,
-            'claude-3-sonnet': 200000,
-            'claude-3-opus': 200000,
-        }
-        return default_windows.get(model_name, 4096)
+        return _DEFAULT_CONTEXT_WINDOWS.get(model_name, 4096)
     
     def get_default_model(self, model_type: str) -> str:
         """
@@ -184,3 +257,108 @@ class BaseProvider(ABC):
             'max_tokens': kwargs.get('max_tokens', self.config.get('max_tokens', 1000)),
             'temperature': kwargs.get('temperature', self.config.get('temperature', 0.7)),
         }
+    
+    def _response_cache_key(self, query: str, model_name: str, model_type: str, **kwargs) -> str:
+        """Build the response cache key for a request."""
+        return ResponseCache.make_key(
+            self.provider_name,
+            model_name,
+            model_type,
+            query,
+            kwargs.get('temperature', self.config.get('temperature')),
+            kwargs.get('max_tokens', self.config.get('max_tokens'))
+        )
+    
+    def get_cached_response(
+        self,
+        query: str,
+        model_name: str,
+        model_type: str,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously stored response for this request.
+        
+        Args:
+            query: Input query
+            model_name: Model name
+            model_type: Type of model
+            **kwargs: Additional parameters
+            
+        Returns:
+            Cached response dictionary, or None on a miss
+            
+        Raises:
+            LookupError: On a miss when the cache is in replay mode
+        """
+        cached = self.response_cache.get(self._response_cache_key(query, model_name, model_type, **kwargs))
+        if cached is None and self.response_cache.replay:
+            raise LookupError("No cached response available in replay mode")
+        return cached
+    
+    def cache_response(
+        self,
+        query: str,
+        model_name: str,
+        model_type: str,
+        response: Dict[str, Any],
+        **kwargs
+    ):
+        """
+        Store a successful response for this request.
+        
+        Args:
+            query: Input query
+            model_name: Model name
+            model_type: Type of model
+            response: Formatted response dictionary
+            **kwargs: Additional parameters
+        """
+        self.response_cache.put(self._response_cache_key(query, model_name, model_type, **kwargs), response)
+    
+    async def acquire_rate_limit(self, query: str, model_name: str, **kwargs):
+        """
+        Wait for capacity under the configured request/token rate limits.
+        
+        Args:
+            query: Input query
+            model_name: Model name
+            **kwargs: Additional parameters
+        """
+        if not self.rate_limiter.enabled:
+            return
+        
+        await self.rate_limiter.acquire(self._estimate_request_tokens(query, model_name, **kwargs))
+    
+    async def acquire_batch_rate_limit(self, queries: List[str], model_name: str, **kwargs):
+        """
+        Wait for capacity for one request that carries several prompts.
+        
+        The batch counts as a single request against the request limit and as
+        the sum of its prompts against the token limit.
+        
+        Args:
+            queries: Input queries sent in the request
+            model_name: Model name
+            **kwargs: Additional parameters
+        """
+        if not self.rate_limiter.enabled:
+            return
+        
+        await self.rate_limiter.acquire(
+            sum(self._estimate_request_tokens(query, model_name, **kwargs) for query in queries)
+        )
+    
+    def _estimate_request_tokens(self, query: str, model_name: str, **kwargs) -> int:
+        """Estimate prompt + completion tokens for rate limiting."""
+        # Short prompts are a rounding error next to max_tokens; skip the tokenizer
+        if len(query) < 64:
+            prompt_tokens = max(1, query.count(' ') + 1)
+        else:
+            prompt_tokens = self.count_tokens(query, model_name)
+        
+        # An explicit max_tokens=None means "use the default", same as leaving it out
+        max_tokens = kwargs.get('max_tokens')
+        if max_tokens is None:
+            max_tokens = self.config.get('max_tokens') or 1000
+        return prompt_tokens + max_tokens
@@ -4,21 +4,221 @@ Hugging Face provider implementation.
 
 import asyncio
 import time
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional
 import os
-import requests
-from .base_provider import BaseProvider
+import json
+import re
+import httpx
+from .base_provider import BaseProvider, copy_characteristics, is_module_available, singleflight
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+
+@lru_cache(maxsize=8)
+def _get_hf_tokenizer(tokenizer_name: str):
+    """Load a Hugging Face tokenizer once per process."""
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(tokenizer_name)
+
+
+# Tokenizer to use for each model family. The family is whichever fragment
+# occurs leftmost in the model name; entry order only breaks ties between
+# fragments that match at the same position, so it doesn't pick the tokenizer
+_HF_TOKENIZER_FAMILIES = {
+    'codellama': 'codellama/CodeLlama-7b-hf',
+    'llama': 'meta-llama/Llama-2-7b-hf',
+    'mistral': 'mistralai/Mistral-7B-v0.1',
+}
+_HF_FAMILY_RE = re.compile('|'.join(_HF_TOKENIZER_FAMILIES), re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _hf_tokenizer_name(model_name: str) -> str:
+    """Resolve the tokenizer used to count tokens for a model."""
+    match = _HF_FAMILY_RE.search(model_name)
+    # Fallback tokenizer
+    return _HF_TOKENIZER_FAMILIES[match.group(0).lower()] if match else 'gpt2'
+
+
+def _format_chat_prompt(query: str) -> str:
+    """Wrap a query in the chat prompt template."""
+    return f"<|user|>\n{query}\n<|assistant|>\n"
+
+
+def _identity_prompt(query: str) -> str:
+    """Pass a query through unchanged."""
+    return query
+
+
+@lru_cache(maxsize=64)
+def _hf_formatter(model_name: str) -> Callable[[str], str]:
+    """Resolve the prompt formatter for a non-base model once per model name."""
+    # For instruct/chat models, format as chat
+    lowered = model_name.lower()
+    if 'chat' in lowered or 'instruct' in lowered:
+        return _format_chat_prompt
+    return _identity_prompt
+
+
+@lru_cache(maxsize=2048)
+def _count_hf_tokens(tokenizer_name: str, text: str) -> int:
+    """Count tokens, memoized by (tokenizer, text) for repeated prompts."""
+    return len(_get_hf_tokenizer(tokenizer_name).encode(text))
+
+
+_HF_CHARACTERISTICS = MappingProxyType({
+    'meta-llama/Llama-2-7b-hf': {
+        'context_window': 4096,
+        'training_cutoff': '2023-07',
+        'strengths': ['Open source', 'Good general performance', 'Commercial use'],
+        'use_cases': ['Text completion', 'Research', 'Fine-tuning base'],
+        'fine_tuning_strategy': 'Supervised fine-tuning',
+        'instruction_following': 'Basic',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'meta-llama/Llama-2-7b-chat-hf': {
+        'context_window': 4096,
+        'training_cutoff': '2023-07',
+        'strengths': ['Chat optimized', 'Open source', 'Safety focused'],
+        'use_cases': ['Conversational AI', 'Q&A', 'Assistant applications'],
+        'fine_tuning_strategy': 'RLHF for helpfulness and safety',
+        'instruction_following': 'Very good',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'meta-llama/Llama-2-13b-chat-hf': {
+        'context_window': 4096,
+        'training_cutoff': '2023-07',
+        'strengths': ['Larger model', 'Better performance', 'Chat optimized'],
+        'use_cases': ['Advanced chat', 'Complex reasoning', 'Content creation'],
+        'fine_tuning_strategy': 'RLHF for helpfulness and safety',
+        'instruction_following': 'Excellent',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'mistralai/Mistral-7B-v0.1': {
+        'context_window': 32768,
+        'training_cutoff': '2023-09',
+        'strengths': ['Large context', 'Efficient', 'Open source'],
+        'use_cases': ['Long document processing', 'Code analysis'],
+        'fine_tuning_strategy': 'Standard pre-training',
+        'instruction_following': 'Basic',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'mistralai/Mistral-7B-Instruct-v0.1': {
+        'context_window': 32768,
+        'training_cutoff': '2023-09',
+        'strengths': ['Instruction following', 'Large context', 'Efficient'],
+        'use_cases': ['Task completion', 'Q&A', 'Analysis'],
+        'fine_tuning_strategy': 'Instruction fine-tuning',
+        'instruction_following': 'Very good',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'codellama/CodeLlama-7b-Python-hf': {
+        'context_window': 16384,
+        'training_cutoff': '2023-07',
+        'strengths': ['Python specialized', 'Code understanding', 'Open source'],
+        'use_cases': ['Python code generation', 'Code completion', 'Debugging'],
+        'fine_tuning_strategy': 'Code-specific fine-tuning on Python',
+        'instruction_following': 'Good (code-focused)',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'codellama/CodeLlama-7b-Instruct-hf': {
+        'context_window': 16384,
+        'training_cutoff': '2023-07',
+        'strengths': ['Code instruction following', 'Multi-language', 'Open source'],
+        'use_cases': ['Code generation', 'Code explanation', 'Programming help'],
+        'fine_tuning_strategy': 'Code + instruction fine-tuning',
+        'instruction_following': 'Very good (code tasks)',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    },
+    'HuggingFaceH4/zephyr-7b-beta': {
+        'context_window': 32768,
+        'training_cutoff': '2023-10',
+        'strengths': ['Chat optimized', 'DPO training', 'Open source'],
+        'use_cases': ['Conversational AI', 'Helpful assistant', 'Q&A'],
+        'fine_tuning_strategy': 'DPO (Direct Preference Optimization)',
+        'instruction_following': 'Excellent',
+        'cost_per_1k_tokens': 'Free (self-hosted)'
+    }
+})
+
+_HF_DEFAULT_CHARACTERISTICS = {
+    'context_window': 4096,
+    'training_cutoff': 'Unknown',
+    'strengths': ['Open source', 'Customizable'],
+    'use_cases': ['General tasks', 'Research'],
+    'fine_tuning_strategy': 'Standard',
+    'instruction_following': 'Variable',
+    'cost_per_1k_tokens': 'Free (self-hosted)'
+}
+
+_HF_CONTEXT_WINDOWS = MappingProxyType({
+    'meta-llama/Llama-2-7b-hf': 4096,
+    'meta-llama/Llama-2-7b-chat-hf': 4096,
+    'meta-llama/Llama-2-13b-hf': 4096,
+    'meta-llama/Llama-2-13b-chat-hf': 4096,
+    'mistralai/Mistral-7B-v0.1': 32768,
+    'mistralai/Mistral-7B-Instruct-v0.1': 32768,
+    'codellama/CodeLlama-7b-Python-hf': 16384,
+    'codellama/CodeLlama-7b-Instruct-hf': 16384,
+    'HuggingFaceH4/zephyr-7b-beta': 32768,
+    'openchat/openchat-3.5-1210': 8192,
+})
+
+_HF_DEFAULT_MODELS = MappingProxyType({
+    'base': 'meta-llama/Llama-2-7b-hf',
+    'instruct': 'meta-llama/Llama-2-7b-chat-hf',
+    'fine-tuned': 'codellama/CodeLlama-7b-Python-hf'
+})
 
 
 class HuggingFaceProvider(BaseProvider):
     """Hugging Face model provider implementation."""
     
+    __slots__ = ('api_key', 'base_url', 'headers', '_parameter_templates', '_client')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_key = config.get('huggingface_api_key') or os.getenv('HUGGINGFACE_API_KEY')
         self.base_url = config.get('huggingface_base_url', 'https://api-inference.huggingface.co')
         self.headers = {'Authorization': f'Bearer {self.api_key}'} if self.api_key else {}
+        
+        # Generation parameters from config, reused unless a call overrides them
+        base_parameters = {
+            "max_new_tokens": config.get('max_tokens', 100),
+            "temperature": config.get('temperature', 0.7),
+            "return_full_text": False
+        }
+        self._parameter_templates = {
+            'base': base_parameters,
+            'chat': {**base_parameters, "do_sample": True}
+        }
+        
+        # Native async client with pooled keep-alive connections
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={**self.headers, 'Content-Type': 'application/json'},
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
+    
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
     
+    @singleflight
     async def generate_response(
         self, 
         query: str, 
@@ -40,89 +240,224 @@ class HuggingFaceProvider(BaseProvider):
         start_time = time.time()
         
         try:
-            # Prepare request
-            url = f"{self.base_url}/models/{model_name}"
+            cached = self.get_cached_response(query, model_name, model_type, **kwargs)
+            if cached is not None:
+                return cached
             
-            # Prepare payload based on model type
-            if model_type == 'base':
-                # For base models, use text generation
-                payload = {
-                    "inputs": query,
-                    "parameters": {
-                        "max_new_tokens": kwargs.get('max_tokens', self.config.get('max_tokens', 100)),
-                        "temperature": kwargs.get('temperature', self.config.get('temperature', 0.7)),
-                        "return_full_text": False
-                    }
-                }
-            else:
-                # For instruct/chat models, format as chat
-                if 'chat' in model_name.lower() or 'instruct' in model_name.lower():
-                    formatted_query = f"<|user|>\n{query}\n<|assistant|>\n"
-                else:
-                    formatted_query = query
-                
-                payload = {
-                    "inputs": formatted_query,
-                    "parameters": {
-                        "max_new_tokens": kwargs.get('max_tokens', self.config.get('max_tokens', 100)),
-                        "temperature": kwargs.get('temperature', self.config.get('temperature', 0.7)),
-                        "return_full_text": False,
-                        "do_sample": True
-                    }
-                }
+            await self.acquire_rate_limit(query, model_name, **kwargs)
+            start_time = time.time()  # Exclude time spent waiting on the rate limiter
+            
+            payload = {
+                "inputs": self._format_query(query, model_type, model_name),
+                "parameters": self._build_parameters(model_type, **kwargs)
+            }
             
             # Make async request
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: requests.post(url, headers=self.headers, json=payload, timeout=30)
-            )
+            response = await self._client.post(f"/models/{model_name}", content=_dumps(payload))
             
             response_time = time.time() - start_time
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 
                 # Extract response text
                 if isinstance(result, list) and len(result) > 0:
-                    response_text = result[0].get('generated_text', '')
-                elif isinstance(result, dict):
-                    response_text = result.get('generated_text', str(result))
+                    response_text = self._extract_generated_text(result[0], default='')
                 else:
-                    response_text = str(result)
+                    response_text = self._extract_generated_text(result)
                 
-                # Estimate token usage (HF API doesn't always provide this)
-                input_tokens = self.count_tokens(query, model_name)
-                output_tokens = self.count_tokens(response_text, model_name)
-                token_usage = {
-                    'input_tokens': input_tokens,
-                    'output_tokens': output_tokens,
-                    'total_tokens': input_tokens + output_tokens
-                }
-                
-                return self.format_response(
-                    response_text=response_text,
-                    model_name=model_name,
-                    model_type=model_type,
-                    token_usage=token_usage,
-                    response_time=response_time
-                )
+                result = self._build_response(query, response_text, model_name, model_type, response_time)
+                self.cache_response(query, model_name, model_type, result, **kwargs)
+                return result
             else:
                 error_msg = f"API error: {response.status_code} - {response.text}"
                 raise Exception(error_msg)
                 
         except Exception as e:
-            return {
-                'provider': self.provider_name,
-                'model_name': model_name,
-                'model_type': model_type,
-                'response': f"Error: {str(e)}",
-                'token_usage': {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0},
-                'characteristics': {},
-                'response_time': time.time() - start_time,
-                'context_window': 0,
-                'error': str(e)
+            return self._build_error_response(str(e), model_name, model_type, time.time() - start_time)
+    
+    async def generate_batch(
+        self,
+        queries: List[str],
+        model_type: str = 'instruct',
+        model_name: Optional[str] = None,
+        batch_size: int = 8,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate responses for several queries, packing up to batch_size
+        prompts into each inference request.
+        
+        Args:
+            queries: Input queries
+            model_type: Type of model (base, instruct, fine-tuned)
+            model_name: Specific model name (optional)
+            batch_size: Maximum number of prompts per request
+            **kwargs: Additional parameters
+            
+        Returns:
+            List of response dictionaries, in the same order as queries
+        """
+        if not self.api_key:
+            raise ValueError("Hugging Face API key not provided.")
+        
+        if not model_name:
+            model_name = self.get_default_model(model_type)
+        
+        if not model_name:
+            raise ValueError(f"No available model for type: {model_type}")
+        
+        batch_size = max(batch_size, 1)
+        batches = [queries[i:i + batch_size] for i in range(0, len(queries), batch_size)]
+        results = await asyncio.gather(*(
+            self._generate_batch_chunk(batch, model_type, model_name, **kwargs)
+            for batch in batches
+        ))
+        return [response for batch_results in results for response in batch_results]
+    
+    async def _generate_batch_chunk(
+        self,
+        queries: List[str],
+        model_type: str,
+        model_name: str,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Send one batched inference request and split the result per query."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        
+        # Serve cached prompts directly and only send the misses
+        pending = []
+        for index, query in enumerate(queries):
+            try:
+                cached = self.get_cached_response(query, model_name, model_type, **kwargs)
+            except LookupError as e:
+                results[index] = self._build_error_response(str(e), model_name, model_type, 0.0)
+                continue
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+        
+        if not pending:
+            return results
+        
+        pending_queries = [queries[index] for index in pending]
+        start_time = time.time()
+        
+        try:
+            await self.acquire_batch_rate_limit(pending_queries, model_name, **kwargs)
+            start_time = time.time()  # Exclude time spent waiting on the rate limiter
+            
+            payload = {
+                "inputs": [self._format_query(query, model_type, model_name) for query in pending_queries],
+                "parameters": self._build_parameters(model_type, **kwargs)
             }
+            
+            response = await self._client.post(f"/models/{model_name}", content=_dumps(payload))
+            
+            response_time = time.time() - start_time
+            
+            if response.status_code != 200:
+                raise Exception(f"API error: {response.status_code} - {response.text}")
+            
+            result = _loads(response.content)
+            if not isinstance(result, list) or len(result) != len(pending_queries):
+                raise Exception(f"Unexpected batch response: {str(result)[:200]}")
+            
+            # Results come back positionally, one entry (or list of candidates) per input
+            responses = [
+                self._build_response(
+                    query,
+                    self._extract_generated_text(item[0] if isinstance(item, list) and item else item, default=''),
+                    model_name,
+                    model_type,
+                    response_time
+                )
+                for query, item in zip(pending_queries, result)
+            ]
+            
+        except Exception as e:
+            elapsed = time.time() - start_time
+            for index in pending:
+                results[index] = self._build_error_response(str(e), model_name, model_type, elapsed)
+            return results
+        
+        for index, query, response in zip(pending, pending_queries, responses):
+            self.cache_response(query, model_name, model_type, response, **kwargs)
+            results[index] = response
+        return results
+    
+    def _format_query(self, query: str, model_type: str, model_name: str) -> str:
+        """Format the prompt for the given model type."""
+        if model_type == 'base':
+            return query
+        return _hf_formatter(model_name)(query)
+    
+    def _build_parameters(self, model_type: str, **kwargs) -> Dict[str, Any]:
+        """Build generation parameters for the given model type."""
+        template = self._parameter_templates['base' if model_type == 'base' else 'chat']
+        
+        overrides = {}
+        if 'max_tokens' in kwargs:
+            overrides["max_new_tokens"] = kwargs['max_tokens']
+        if 'temperature' in kwargs:
+            overrides["temperature"] = kwargs['temperature']
+        
+        # Templates are shared across calls and only read during serialization
+        return {**template, **overrides} if overrides else template
+    
+    @staticmethod
+    def _extract_generated_text(result: Any, default: Optional[str] = None) -> str:
+        """Extract generated text from a single inference result."""
+        if isinstance(result, dict):
+            return result.get('generated_text', str(result) if default is None else default)
+        return str(result)
+    
+    def _build_response(
+        self,
+        query: str,
+        response_text: str,
+        model_name: str,
+        model_type: str,
+        response_time: float
+    ) -> Dict[str, Any]:
+        """Format a successful response with estimated token usage."""
+        # Estimate token usage (HF API doesn't always provide this)
+        input_tokens = self.count_tokens(query, model_name)
+        output_tokens = self.count_tokens(response_text, model_name)
+        token_usage = {
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens
+        }
+        
+        return self.format_response(
+            response_text=response_text,
+            model_name=model_name,
+            model_type=model_type,
+            token_usage=token_usage,
+            response_time=response_time
+        )
+    
+    def _build_error_response(
+        self,
+        error: str,
+        model_name: str,
+        model_type: str,
+        response_time: float
+    ) -> Dict[str, Any]:
+        """Format an error response."""
+        return {
+            'provider': self.provider_name,
+            'model_name': model_name,
+            'model_type': model_type,
+            'response': f"Error: {error}",
+            'token_usage': {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0},
+            'characteristics': {},
+            'response_time': response_time,
+            'context_window': 0,
+            'error': error
+        }
     
     def get_available_models(self) -> Dict[str, List[str]]:
         """Get available Hugging Face models."""
@@ -153,139 +488,28 @@ class HuggingFaceProvider(BaseProvider):
     
     def get_model_characteristics(self, model_name: str) -> Dict[str, Any]:
         """Get characteristics of Hugging Face models."""
-        characteristics = {
-            'meta-llama/Llama-2-7b-hf': {
-                'context_window': 4096,
-                'training_cutoff': '2023-07',
-                'strengths': ['Open source', 'Good general performance', 'Commercial use'],
-                'use_cases': ['Text completion', 'Research', 'Fine-tuning base'],
-                'fine_tuning_strategy': 'Supervised fine-tuning',
-                'instruction_following': 'Basic',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'meta-llama/Llama-2-7b-chat-hf': {
-                'context_window': 4096,
-                'training_cutoff': '2023-07',
-                'strengths': ['Chat optimized', 'Open source', 'Safety focused'],
-                'use_cases': ['Conversational AI', 'Q&A', 'Assistant applications'],
-                'fine_tuning_strategy': 'RLHF for helpfulness and safety',
-                'instruction_following': 'Very good',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'meta-llama/Llama-2-13b-chat-hf': {
-                'context_window': 4096,
-                'training_cutoff': '2023-07',
-                'strengths': ['Larger model', 'Better performance', 'Chat optimized'],
-                'use_cases': ['Advanced chat', 'Complex reasoning', 'Content creation'],
-                'fine_tuning_strategy': 'RLHF for helpfulness and safety',
-                'instruction_following': 'Excellent',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'mistralai/Mistral-7B-v0.1': {
-                'context_window': 32768,
-                'training_cutoff': '2023-09',
-                'strengths': ['Large context', 'Efficient', 'Open source'],
-                'use_cases': ['Long document processing', 'Code analysis'],
-                'fine_tuning_strategy': 'Standard pre-training',
-                'instruction_following': 'Basic',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'mistralai/Mistral-7B-Instruct-v0.1': {
-                'context_window': 32768,
-                'training_cutoff': '2023-09',
-                'strengths': ['Instruction following', 'Large context', 'Efficient'],
-                'use_cases': ['Task completion', 'Q&A', 'Analysis'],
-                'fine_tuning_strategy': 'Instruction fine-tuning',
-                'instruction_following': 'Very good',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'codellama/CodeLlama-7b-Python-hf': {
-                'context_window': 16384,
-                'training_cutoff': '2023-07',
-                'strengths': ['Python specialized', 'Code understanding', 'Open source'],
-                'use_cases': ['Python code generation', 'Code completion', 'Debugging'],
-                'fine_tuning_strategy': 'Code-specific fine-tuning on Python',
-                'instruction_following': 'Good (code-focused)',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'codellama/CodeLlama-7b-Instruct-hf': {
-                'context_window': 16384,
-                'training_cutoff': '2023-07',
-                'strengths': ['Code instruction following', 'Multi-language', 'Open source'],
-                'use_cases': ['Code generation', 'Code explanation', 'Programming help'],
-                'fine_tuning_strategy': 'Code + instruction fine-tuning',
-                'instruction_following': 'Very good (code tasks)',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            },
-            'HuggingFaceH4/zephyr-7b-beta': {
-                'context_window': 32768,
-                'training_cutoff': '2023-10',
-                'strengths': ['Chat optimized', 'DPO training', 'Open source'],
-                'use_cases': ['Conversational AI', 'Helpful assistant', 'Q&A'],
-                'fine_tuning_strategy': 'DPO (Direct Preference Optimization)',
-                'instruction_following': 'Excellent',
-                'cost_per_1k_tokens': 'Free (self-hosted)'
-            }
-        }
-        
-        return characteristics.get(model_name, {
-            'context_window': 4096,
-            'training_cutoff': 'Unknown',
-            'strengths': ['Open source', 'Customizable'],
-            'use_cases': ['General tasks', 'Research'],
-            'fine_tuning_strategy': 'Standard',
-            'instruction_following': 'Variable',
-            'cost_per_1k_tokens': 'Free (self-hosted)'
-        })
+        return copy_characteristics(_HF_CHARACTERISTICS.get(model_name, _HF_DEFAULT_CHARACTERISTICS))
     
     def count_tokens(self, text: str, model_name: str) -> int:
         """Count tokens for Hugging Face models."""
+        if not is_module_available('transformers'):
+            # Fallback to word-based estimation
+            return int(len(text.split()) * 1.3)
+        
         try:
-            # Try to use transformers tokenizer if available
-            from transformers import AutoTokenizer
-            
-            # Use a compatible tokenizer
-            if 'llama' in model_name.lower():
-                tokenizer_name = 'meta-llama/Llama-2-7b-hf'
-            elif 'mistral' in model_name.lower():
-                tokenizer_name = 'mistralai/Mistral-7B-v0.1'
-            elif 'codellama' in model_name.lower():
-                tokenizer_name = 'codellama/CodeLlama-7b-hf'
-            else:
-                # Fallback tokenizer
-                tokenizer_name = 'gpt2'
-            
-            tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
-            return len(tokenizer.encode(text))
+            return _count_hf_tokens(_hf_tokenizer_name(model_name), text)
             
         except (ImportError, Exception):
             # Fallback to word-based estimation
-            return len(text.split()) * 1.3
+            return int(len(text.split()) * 1.3)
     
     def get_context_window(self, model_name: str) -> int:
         """Get context window size for Hugging Face models."""
-        windows = {
-            'meta-llama/Llama-2-7b-hf': 4096,
-            'meta-llama/Llama-2-7b-chat-hf': 4096,
-            'meta-llama/Llama-2-13b-hf': 4096,
-            'meta-llama/Llama-2-13b-chat-hf': 4096,
-            'mistralai/Mistral-7B-v0.1': 32768,
-            'mistralai/Mistral-7B-Instruct-v0.1': 32768,
-            'codellama/CodeLlama-7b-Python-hf': 16384,
-            'codellama/CodeLlama-7b-Instruct-hf': 16384,
-            'HuggingFaceH4/zephyr-7b-beta': 32768,
-            'openchat/openchat-3.5-1210': 8192,
-        }
-        return windows.get(model_name, 4096)
+        return _HF_CONTEXT_WINDOWS.get(model_name, 4096)
     
     def get_default_model(self, model_type: str) -> str:
         """Get default Hugging Face model for type."""
-        defaults = {
-            'base': 'meta-llama/Llama-2-7b-hf',
-            'instruct': 'meta-llama/Llama-2-7b-chat-hf',
-            'fine-tuned': 'codellama/CodeLlama-7b-Python-hf'
-        }
-        return defaults.get(model_type)
+        return _HF_DEFAULT_MODELS.get(model_type)
     
     def validate_api_key(self) -> bool:
         """Validate Hugging Face API key."""
@@ -2,32 +2,169 @@
 OpenAI provider implementation.
 """
 
-import asyncio
+import re
 import time
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, List, Optional
 import os
-from .base_provider import BaseProvider
+from .base_provider import BaseProvider, copy_characteristics, is_module_available, singleflight
+
+
+# Encoding family for each model prefix; anything else uses cl100k_base
+_OPENAI_ENCODING_FAMILIES = {
+    'gpt-4': 'gpt-4',
+    'gpt-3.5': 'gpt-3.5-turbo',
+}
+_OPENAI_FAMILY_RE = re.compile('|'.join(re.escape(prefix) for prefix in _OPENAI_ENCODING_FAMILIES))
+
+
+@lru_cache(maxsize=256)
+def _openai_encoding_family(model_name: str) -> str:
+    """Resolve the tiktoken encoding family for a model."""
+    match = _OPENAI_FAMILY_RE.search(model_name)
+    return _OPENAI_ENCODING_FAMILIES[match.group(0)] if match else 'cl100k_base'
+
+
+@lru_cache(maxsize=4)
+def _get_openai_encoding(encoding_family: str):
+    """Build a tiktoken Encoding once per process."""
+    import tiktoken
+    
+    if encoding_family == 'cl100k_base':
+        return tiktoken.get_encoding(encoding_family)
+    return tiktoken.encoding_for_model(encoding_family)
+
+
+@lru_cache(maxsize=2048)
+def _count_openai_tokens(encoding_family: str, text: str) -> int:
+    """Count tokens, memoized by (encoding family, text) for repeated prompts."""
+    # Prompts are plain text, so skip the special-token scan done by encode()
+    return len(_get_openai_encoding(encoding_family).encode_ordinary(text))
+
+
+_OPENAI_CHARACTERISTICS = MappingProxyType({
+    'gpt-3.5-turbo': {
+        'context_window': 4096,
+        'training_cutoff': '2021-09',
+        'strengths': ['Fast response', 'Cost-effective', 'Good general performance'],
+        'use_cases': ['Chat', 'Q&A', 'Text completion'],
+        'fine_tuning_strategy': 'Instruction following, human feedback (RLHF)',
+        'instruction_following': 'Excellent',
+        'cost_per_1k_tokens': '$0.001-0.002'
+    },
+    'gpt-3.5-turbo-16k': {
+        'context_window': 16384,
+        'training_cutoff': '2021-09',
+        'strengths': ['Larger context', 'Fast response', 'Cost-effective'],
+        'use_cases': ['Long document analysis', 'Extended conversations'],
+        'fine_tuning_strategy': 'Instruction following, human feedback (RLHF)',
+        'instruction_following': 'Excellent',
+        'cost_per_1k_tokens': '$0.003-0.004'
+    },
+    'gpt-4': {
+        'context_window': 8192,
+        'training_cutoff': '2021-09',
+        'strengths': ['Advanced reasoning', 'Better accuracy', 'Complex tasks'],
+        'use_cases': ['Complex analysis', 'Creative writing', 'Problem solving'],
+        'fine_tuning_strategy': 'Advanced RLHF, constitutional AI',
+        'instruction_following': 'Outstanding',
+        'cost_per_1k_tokens': '$0.03-0.06'
+    },
+    'gpt-4-turbo': {
+        'context_window': 128000,
+        'training_cutoff': '2023-12',
+        'strengths': ['Large context', 'Latest training data', 'Multimodal'],
+        'use_cases': ['Long document processing', 'Code analysis', 'Research'],
+        'fine_tuning_strategy': 'Advanced RLHF, constitutional AI',
+        'instruction_following': 'Outstanding',
+        'cost_per_1k_tokens': '$0.01-0.03'
+    },
+    'gpt-4o': {
+        'context_window': 128000,
+        'training_cutoff': '2023-10',
+        'strengths': ['Multimodal', 'Fast', 'Cost-effective'],
+        'use_cases': ['Vision tasks', 'Audio processing', 'General chat'],
+        'fine_tuning_strategy': 'Optimized RLHF for efficiency',
+        'instruction_following': 'Outstanding',
+        'cost_per_1k_tokens': '$0.005-0.015'
+    },
+    'gpt-4o-mini': {
+        'context_window': 128000,
+        'training_cutoff': '2023-10',
+        'strengths': ['Very cost-effective', 'Fast', 'Good performance'],
+        'use_cases': ['High-volume applications', 'Simple tasks', 'Prototyping'],
+        'fine_tuning_strategy': 'Distilled from GPT-4o',
+        'instruction_following': 'Very good',
+        'cost_per_1k_tokens': '$0.0001-0.0006'
+    },
+    'gpt-3.5-turbo-instruct': {
+        'context_window': 4096,
+        'training_cutoff': '2021-09',
+        'strengths': ['Text completion', 'Lower instruction bias'],
+        'use_cases': ['Text completion', 'Creative writing', 'Code completion'],
+        'fine_tuning_strategy': 'Minimal instruction tuning',
+        'instruction_following': 'Basic',
+        'cost_per_1k_tokens': '$0.0015-0.002'
+    }
+})
+
+_OPENAI_DEFAULT_CHARACTERISTICS = {
+    'context_window': 4096,
+    'training_cutoff': 'Unknown',
+    'strengths': ['General purpose'],
+    'use_cases': ['General tasks'],
+    'fine_tuning_strategy': 'Standard',
+    'instruction_following': 'Good',
+    'cost_per_1k_tokens': 'Variable'
+}
+
+_OPENAI_CONTEXT_WINDOWS = MappingProxyType({
+    'gpt-3.5-turbo': 4096,
+    'gpt-3.5-turbo-16k': 16384,
+    'gpt-4': 8192,
+    'gpt-4-32k': 32768,
+    'gpt-4-turbo': 128000,
+    'gpt-4-turbo-preview': 128000,
+    'gpt-4o': 128000,
+    'gpt-4o-mini': 128000,
+    'gpt-3.5-turbo-instruct': 4096,
+    'text-davinci-003': 4097,
+})
+
+_OPENAI_DEFAULT_MODELS = MappingProxyType({
+    'base': 'gpt-3.5-turbo-instruct',
+    'instruct': 'gpt-3.5-turbo',
+    'fine-tuned': 'gpt-3.5-turbo-ft'
+})
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI model provider implementation."""
     
+    __slots__ = ('api_key', 'base_url', 'client')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_key = config.get('openai_api_key') or os.getenv('OPENAI_API_KEY')
         self.base_url = config.get('openai_base_url', 'https://api.openai.com/v1')
         self.client = None
-        
-        if self.api_key:
+    
+    def _ensure_client(self):
+        """Create the OpenAI client on first use, importing the SDK lazily."""
+        if self.client is None and self.api_key:
             try:
                 import openai
-                self.client = openai.AsyncOpenAI(
-                    api_key=self.api_key,
-                    base_url=self.base_url
-                )
             except ImportError:
                 raise ImportError("OpenAI package not installed. Run: pip install openai")
+            
+            self.client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url
+            )
+        return self.client
     
+    @singleflight
     async def generate_response(
         self, 
         query: str, 
@@ -36,7 +173,7 @@ class OpenAIProvider(BaseProvider):
         **kwargs
     ) -> Dict[str, Any]:
         """Generate response using OpenAI models."""
-        if not self.client:
+        if not self._ensure_client():
             raise ValueError("OpenAI client not initialized. Check API key.")
         
         # Select model based on type
@@ -48,32 +185,63 @@ class OpenAIProvider(BaseProvider):
         
         start_time = time.time()
         
+        # Streamed calls are made to measure time-to-first-token, which a cached result can't provide
+        stream = bool(kwargs.get('stream'))
+        
         try:
+            if not stream:
+                cached = self.get_cached_response(query, model_name, model_type, **kwargs)
+                if cached is not None:
+                    return cached
+            
+            await self.acquire_rate_limit(query, model_name, **kwargs)
+            start_time = time.time()  # Exclude time spent waiting on the rate limiter
+            
             # Prepare request parameters
             params = self.prepare_request_params(query, model_name, **kwargs)
             
-            # Make API call
-            response = await self.client.chat.completions.create(**params)
+            first_token_time = None
+            if stream:
+                # Stream the completion, recording when the first token arrives
+                response_text, usage, first_token_time = await self._collect_stream(params, start_time)
+            else:
+                # Make API call
+                response = await self.client.chat.completions.create(**params)
+                
+                # Extract response text
+                response_text = response.choices[0].message.content
+                usage = response.usage
             
             response_time = time.time() - start_time
             
-            # Extract response text
-            response_text = response.choices[0].message.content
-            
             # Extract token usage
-            token_usage = {
-                'input_tokens': response.usage.prompt_tokens,
-                'output_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+            if usage is not None:
+                token_usage = {
+                    'input_tokens': usage.prompt_tokens,
+                    'output_tokens': usage.completion_tokens,
+                    'total_tokens': usage.total_tokens
+                }
+            else:
+                input_tokens = self.count_tokens(query, model_name)
+                output_tokens = self.count_tokens(response_text, model_name)
+                token_usage = {
+                    'input_tokens': input_tokens,
+                    'output_tokens': output_tokens,
+                    'total_tokens': input_tokens + output_tokens
+                }
             
-            return self.format_response(
+            result = self.format_response(
                 response_text=response_text,
                 model_name=model_name,
                 model_type=model_type,
                 token_usage=token_usage,
                 response_time=response_time
             )
+            if first_token_time is not None:
+                result['first_token_time'] = first_token_time
+            if not stream:
+                self.cache_response(query, model_name, model_type, result, **kwargs)
+            return result
             
         except Exception as e:
             return {
@@ -88,6 +256,74 @@ class OpenAIProvider(BaseProvider):
                 'error': str(e)
             }
     
+    async def stream_response(
+        self,
+        query: str,
+        model_type: str = 'instruct',
+        model_name: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream response text from OpenAI models as it is generated.
+        
+        Args:
+            query: Input query
+            model_type: Type of model (base, instruct, fine-tuned)
+            model_name: Specific model name (optional)
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response text chunks in order
+        """
+        if not self._ensure_client():
+            raise ValueError("OpenAI client not initialized. Check API key.")
+        
+        if not model_name:
+            model_name = self.get_default_model(model_type)
+        
+        if not model_name:
+            raise ValueError(f"No available model for type: {model_type}")
+        
+        await self.acquire_rate_limit(query, model_name, **kwargs)
+        
+        params = self.prepare_request_params(query, model_name, **kwargs)
+        stream = await self.client.chat.completions.create(**params, stream=True)
+        
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ''
+    
+    async def _collect_stream(self, params: Dict[str, Any], start_time: float):
+        """
+        Consume a streamed completion.
+        
+        Returns:
+            Tuple of (response text, usage or None, seconds to first token)
+        """
+        stream = await self.client.chat.completions.create(
+            **params,
+            stream=True,
+            stream_options={'include_usage': True}
+        )
+        
+        parts = []
+        usage = None
+        first_token_time = None
+        
+        async for chunk in stream:
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            
+            content = chunk.choices[0].delta.content
+            if content:
+                if first_token_time is None:
+                    first_token_time = time.time() - start_time
+                parts.append(content)
+        
+        return ''.join(parts), usage, first_token_time
+    
     def get_available_models(self) -> Dict[str, List[str]]:
         """Get available OpenAI models."""
         return {
@@ -112,125 +348,23 @@ class OpenAIProvider(BaseProvider):
     
     def get_model_characteristics(self, model_name: str) -> Dict[str, Any]:
         """Get characteristics of OpenAI models."""
-        characteristics = {
-            'gpt-3.5-turbo': {
-                'context_window': 4096,
-                'training_cutoff': '2021-09',
-                'strengths': ['Fast response', 'Cost-effective', 'Good general performance'],
-                'use_cases': ['Chat', 'Q&A', 'Text completion'],
-                'fine_tuning_strategy': 'Instruction following, human feedback (RLHF)',
-                'instruction_following': 'Excellent',
-                'cost_per_1k_tokens': '$0.001-0.002'
-            },
-            'gpt-3.5-turbo-16k': {
-                'context_window': 16384,
-                'training_cutoff': '2021-09',
-                'strengths': ['Larger context', 'Fast response', 'Cost-effective'],
-                'use_cases': ['Long document analysis', 'Extended conversations'],
-                'fine_tuning_strategy': 'Instruction following, human feedback (RLHF)',
-                'instruction_following': 'Excellent',
-                'cost_per_1k_tokens': '$0.003-0.004'
-            },
-            'gpt-4': {
-                'context_window': 8192,
-                'training_cutoff': '2021-09',
-                'strengths': ['Advanced reasoning', 'Better accuracy', 'Complex tasks'],
-                'use_cases': ['Complex analysis', 'Creative writing', 'Problem solving'],
-                'fine_tuning_strategy': 'Advanced RLHF, constitutional AI',
-                'instruction_following': 'Outstanding',
-                'cost_per_1k_tokens': '$0.03-0.06'
-            },
-            'gpt-4-turbo': {
-                'context_window': 128000,
-                'training_cutoff': '2023-12',
-                'strengths': ['Large context', 'Latest training data', 'Multimodal'],
-                'use_cases': ['Long document processing', 'Code analysis', 'Research'],
-                'fine_tuning_strategy': 'Advanced RLHF, constitutional AI',
-                'instruction_following': 'Outstanding',
-                'cost_per_1k_tokens': '$0.01-0.03'
-            },
-            'gpt-4o': {
-                'context_window': 128000,
-                'training_cutoff': '2023-10',
-                'strengths': ['Multimodal', 'Fast', 'Cost-effective'],
-                'use_cases': ['Vision tasks', 'Audio processing', 'General chat'],
-                'fine_tuning_strategy': 'Optimized RLHF for efficiency',
-                'instruction_following': 'Outstanding',
-                'cost_per_1k_tokens': '$0.005-0.015'
-            },
-            'gpt-4o-mini': {
-                'context_window': 128000,
-                'training_cutoff': '2023-10',
-                'strengths': ['Very cost-effective', 'Fast', 'Good performance'],
-                'use_cases': ['High-volume applications', 'Simple tasks', 'Prototyping'],
-                'fine_tuning_strategy': 'Distilled from GPT-4o',
-                'instruction_following': 'Very good',
-                'cost_per_1k_tokens': '$0.0001-0.0006'
-            },
-            'gpt-3.5-turbo-instruct': {
-                'context_window': 4096,
-                'training_cutoff': '2021-09',
-                'strengths': ['Text completion', 'Lower instruction bias'],
-                'use_cases': ['Text completion', 'Creative writing', 'Code completion'],
-                'fine_tuning_strategy': 'Minimal instruction tuning',
-                'instruction_following': 'Basic',
-                'cost_per_1k_tokens': '$0.0015-0.002'
-            }
-        }
-        
-        return characteristics.get(model_name, {
-            'context_window': 4096,
-            'training_cutoff': 'Unknown',
-            'strengths': ['General purpose'],
-            'use_cases': ['General tasks'],
-            'fine_tuning_strategy': 'Standard',
-            'instruction_following': 'Good',
-            'cost_per_1k_tokens': 'Variable'
-        })
+        return copy_characteristics(_OPENAI_CHARACTERISTICS.get(model_name, _OPENAI_DEFAULT_CHARACTERISTICS))
     
     def count_tokens(self, text: str, model_name: str) -> int:
         """Count tokens using tiktoken."""
-        try:
-            import tiktoken
-            
-            # Get encoding for model
-            if 'gpt-4' in model_name:
-                encoding = tiktoken.encoding_for_model("gpt-4")
-            elif 'gpt-3.5' in model_name:
-                encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
-            else:
-                encoding = tiktoken.get_encoding("cl100k_base")
-            
-            return len(encoding.encode(text))
-            
-        except ImportError:
+        if not is_module_available('tiktoken'):
             # Fallback to word-based estimation
-            return len(text.split()) * 1.3  # Rough approximation
+            return int(len(text.split()) * 1.3)  # Rough approximation
+        
+        return _count_openai_tokens(_openai_encoding_family(model_name), text)
     
     def get_context_window(self, model_name: str) -> int:
         """Get context window size for OpenAI models."""
-        windows = {
-            'gpt-3.5-turbo': 4096,
-            'gpt-3.5-turbo-16k': 16384,
-            'gpt-4': 8192,
-            'gpt-4-32k': 32768,
-            'gpt-4-turbo': 128000,
-            'gpt-4-turbo-preview': 128000,
-            'gpt-4o': 128000,
-            'gpt-4o-mini': 128000,
-            'gpt-3.5-turbo-instruct': 4096,
-            'text-davinci-003': 4097,
-        }
-        return windows.get(model_name, 4096)
+        return _OPENAI_CONTEXT_WINDOWS.get(model_name, 4096)
     
     def get_default_model(self, model_type: str) -> str:
         """Get default OpenAI model for type."""
-        defaults = {
-            'base': 'gpt-3.5-turbo-instruct',
-            'instruct': 'gpt-3.5-turbo',
-            'fine-tuned': 'gpt-3.5-turbo-ft'
-        }
-        return defaults.get(model_type)
+        return _OPENAI_DEFAULT_MODELS.get(model_type)
     
     def validate_api_key(self) -> bool:
         """Validate OpenAI API key."""
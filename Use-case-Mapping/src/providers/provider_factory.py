@@ -2,19 +2,59 @@
 Provider factory for creating model provider instances.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
+import asyncio
 import os
+import weakref
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
 from .huggingface_provider import HuggingFaceProvider
 
 
+# Event loops that already received a resized default executor
+_configured_loops = weakref.WeakSet()
+
+
+def configure_default_executor(max_workers: int) -> bool:
+    """
+    Size the running event loop's default executor for I/O-bound API calls.
+    
+    The stock executor is capped at min(32, cpu_count + 4) threads, which throttles
+    any blocking SDK call offloaded with run_in_executor or asyncio.to_thread.
+    
+    Args:
+        max_workers: Maximum number of worker threads
+        
+    Returns:
+        True if the executor was installed, False if no loop is running or the
+        loop was already configured
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    
+    if loop in _configured_loops:
+        return False
+    
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-io'))
+    _configured_loops.add(loop)
+    return True
+
+
 class ProviderFactory:
     """Factory class for creating model provider instances."""
     
+    __slots__ = ('config', '_providers', '_available')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self._providers = {}
+        self._available: Optional[list[str]] = None
+        
+        max_parallel_requests = config.get('max_parallel_requests') or (os.cpu_count() or 1) * 5
+        configure_default_executor(max_parallel_requests)
     
     def get_provider(self, provider_name: str):
         """
@@ -29,11 +69,11 @@ class ProviderFactory:
         Raises:
             ValueError: If provider is not supported or not configured
         """
+        provider_name = provider_name.lower()
+        
         if provider_name in self._providers:
             return self._providers[provider_name]
         
-        provider_name = provider_name.lower()
-        
         if provider_name == 'openai':
             provider = self._create_openai_provider()
         elif provider_name == 'anthropic':
@@ -77,6 +117,9 @@ class ProviderFactory:
         Returns:
             List of available provider names
         """
+        if self._available is not None:
+            return list(self._available)
+        
         available = []
         
         # Check OpenAI
@@ -91,7 +134,8 @@ class ProviderFactory:
         if self.config.get('huggingface_api_key') or os.getenv('HUGGINGFACE_API_KEY'):
             available.append('huggingface')
         
-        return available
+        self._available = available
+        return list(available)
     
     def validate_provider_config(self, provider_name: str) -> bool:
         """
@@ -127,3 +171,8 @@ class ProviderFactory:
                 continue
         
         return all_models
+    
+    def invalidate(self):
+        """Drop cached provider instances and availability after a config change."""
+        self._providers.clear()
+        self._available = None
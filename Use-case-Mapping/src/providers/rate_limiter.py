@@ -0,0 +1,70 @@
+"""
+Client-side rate limiting for model providers.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Request-per-minute and token-per-minute limiter for async callers."""
+    
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self._requests = float(self.rpm or 0)
+        self._tokens = float(self.tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self.rpm is not None or self.tpm is not None
+    
+    def _refill(self):
+        """Refill both buckets in proportion to elapsed time."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+    
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until a request of the given size can be admitted."""
+        wait = 0.0
+        if self.rpm and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+        return wait
+    
+    async def acquire(self, estimated_tokens: float = 0):
+        """
+        Wait until one request of the given size fits within the limits.
+        
+        Args:
+            estimated_tokens: Expected prompt + completion tokens for the request
+        """
+        if not self.enabled:
+            return
+        
+        # A request larger than the whole bucket would otherwise never be admitted
+        tokens = min(estimated_tokens, self.tpm) if self.tpm else 0
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            
+            if self.rpm:
+                self._requests -= 1
+            if self.tpm:
+                self._tokens -= tokens
@@ -0,0 +1,158 @@
+"""
+Persistent response cache for model providers.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+# Cache policies
+CACHE_ENABLED = 'enabled'        # Read hits, write misses
+CACHE_READ_ONLY = 'read_only'    # Read hits, never write
+CACHE_WRITE_ONLY = 'write_only'  # Always call the API, write results
+CACHE_REPLAY = 'replay'          # Serve only from cache, ignoring expiry
+CACHE_DISABLED = 'disabled'      # Bypass the cache entirely
+
+CACHE_POLICIES = frozenset({
+    CACHE_ENABLED,
+    CACHE_READ_ONLY,
+    CACHE_WRITE_ONLY,
+    CACHE_REPLAY,
+    CACHE_DISABLED,
+})
+
+
+class ResponseCache:
+    """SQLite-backed cache of model responses keyed by request SHA-256."""
+    
+    def __init__(self, path: str, policy: str = CACHE_ENABLED, ttl: Optional[int] = None):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Invalid cache policy: {policy}. Must be one of: {sorted(CACHE_POLICIES)}")
+        
+        self.path = path
+        self.policy = policy
+        self.ttl = ttl
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResponseCache':
+        """Create a cache from configuration settings."""
+        policy = config.get('cache_policy', CACHE_ENABLED)
+        if not config.get('enable_cache', False):
+            policy = CACHE_DISABLED
+        
+        return cls(
+            path=config.get('cache_file', 'response_cache.db'),
+            policy=policy,
+            ttl=config.get('cache_duration')
+        )
+    
+    @property
+    def readable(self) -> bool:
+        """Whether lookups are served from the cache."""
+        return self.policy in (CACHE_ENABLED, CACHE_READ_ONLY, CACHE_REPLAY)
+    
+    @property
+    def writable(self) -> bool:
+        """Whether new responses are stored in the cache."""
+        return self.policy in (CACHE_ENABLED, CACHE_WRITE_ONLY)
+    
+    @property
+    def replay(self) -> bool:
+        """Whether cache misses must not fall through to the API."""
+        return self.policy == CACHE_REPLAY
+    
+    @staticmethod
+    def make_key(
+        provider: str,
+        model_name: str,
+        model_type: str,
+        query: str,
+        temperature: Any,
+        max_tokens: Any
+    ) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            provider: Provider name
+            model_name: Model name
+            model_type: Model type
+            query: Input query
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+        
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        material = json.dumps([provider, model_name, model_type, query, temperature, max_tokens])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(key TEXT PRIMARY KEY, blob BLOB, ts INTEGER)'
+            )
+            self._conn.commit()
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached response dictionary, or None on a miss
+        """
+        if not self.readable:
+            return None
+        
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT blob, ts FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        blob, ts = row
+        if not self.replay and self.ttl and time.time() - ts > self.ttl:
+            return None
+        
+        return json.loads(blob)
+    
+    def put(self, key: str, response: Dict[str, Any]):
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from make_key()
+            response: Response dictionary to store
+        """
+        if not self.writable:
+            return
+        
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, blob, ts) VALUES (?, ?, ?)',
+                (key, json.dumps(response), int(time.time()))
+            )
+            conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
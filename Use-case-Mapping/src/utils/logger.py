@@ -2,10 +2,100 @@
 Logging configuration and utilities.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
-from typing import Optional
-from datetime import datetime
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+
+class BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    File handler that buffers records and writes them in batches.
+    
+    Records are flushed when the buffer reaches capacity, when an ERROR or
+    higher record arrives, or every flush_interval seconds from a background
+    thread. Each flush formats the whole batch and issues a single write.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        capacity: int = 1024,
+        flush_interval: float = 0.2,
+        encoding: str = 'utf-8'
+    ):
+        super().__init__(
+            capacity,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler(filename, encoding=encoding),
+            flushOnClose=True
+        )
+        self.flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name='log-flush',
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        """Flush pending records until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered records to the file in one call."""
+        with self.lock:
+            if not self.buffer or self.target is None:
+                return
+            
+            data = ''.join(self.format(record) + '\n' for record in self.buffer)
+            self.buffer.clear()
+            
+            target = self.target
+            with target.lock:
+                if target.stream is None:
+                    target.stream = target._open()
+                target.stream.write(data)
+                target.stream.flush()
+    
+    def close(self):
+        """Stop the flush thread, write remaining records and close the file."""
+        self._stop_flushing.set()
+        # MemoryHandler.close() drops the target reference, so hold on to it here
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
+# Queue listeners started by setup_logger, keyed by logger name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listener(logger_name: str):
+    """Stop a logger's queue listener and close the handlers it feeds."""
+    listener = _listeners.pop(logger_name, None)
+    if listener is None:
+        return
+    
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners():
+    """Drain and stop every queue listener at interpreter exit."""
+    for logger_name in list(_listeners):
+        _stop_listener(logger_name)
 
 
 def setup_logger(
@@ -24,12 +114,17 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    log_level = getattr(logging, level.upper())
+    
     # Create logger
     logger = logging.getLogger(logger_name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
     
-    # Clear existing handlers
-    logger.handlers.clear()
+    # Stop the previous listener (draining its queue) and clear existing handlers
+    _stop_listener(logger_name)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
     
     # Create formatter
     formatter = logging.Formatter(
@@ -39,25 +134,36 @@ def setup_logger(
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
+    file_handler_error = None
     if log_file:
         try:
             # Create log directory if it doesn't exist
             log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
             
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler = BufferedFileHandler(log_file, encoding='utf-8')
             file_handler.setLevel(logging.DEBUG)  # Log everything to file
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
         except Exception as e:
-            logger.warning(f"Could not create file handler: {e}")
+            file_handler_error = e
+    
+    # Callers only enqueue records; a background listener does the formatting and I/O
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[logger_name] = listener
+    
+    if file_handler_error is not None:
+        logger.warning("Could not create file handler: %s", file_handler_error)
     
     return logger
 
@@ -79,10 +185,11 @@ def log_model_request(
         query: Input query
         start_time: Request start time
     """
-    logger.info(
-        f"Model Request - Provider: {provider}, Model: {model_name}, "
-        f"Query length: {len(query)} chars, Started: {datetime.fromtimestamp(start_time)}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Model Request - Provider: %s, Model: %s, Query length: %d chars, Started: %s",
+            provider, model_name, len(query), time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))
+        )
 
 
 def log_model_response(
@@ -108,22 +215,23 @@ def log_model_response(
         success: Whether request was successful
         error: Error message if failed
     """
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+    
     status = "SUCCESS" if success else "ERROR"
     
     log_msg = (
-        f"Model Response - Provider: {provider}, Model: {model_name}, "
-        f"Status: {status}, Response length: {response_length} chars, "
-        f"Tokens: {token_usage.get('total_tokens', 'N/A')}, "
-        f"Time: {response_time:.2f}s"
+        "Model Response - Provider: %s, Model: %s, Status: %s, "
+        "Response length: %d chars, Tokens: %s, Time: %.2fs"
     )
+    args = [provider, model_name, status, response_length, token_usage.get('total_tokens', 'N/A'), response_time]
     
     if error:
-        log_msg += f", Error: {error}"
+        log_msg += ", Error: %s"
+        args.append(error)
     
-    if success:
-        logger.info(log_msg)
-    else:
-        logger.error(log_msg)
+    logger.log(level, log_msg, *args)
 
 
 def log_comparison_start(
@@ -141,10 +249,11 @@ def log_comparison_start(
         providers: List of providers
         model_types: List of model types
     """
-    logger.info(
-        f"Comparison Started - Query: '{query[:50]}...', "
-        f"Providers: {providers}, Model Types: {model_types}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Comparison Started - Query: '%.50s...', Providers: %s, Model Types: %s",
+            query, providers, model_types
+        )
 
 
 def log_comparison_complete(
@@ -163,8 +272,8 @@ def log_comparison_complete(
         total_time: Total time taken
     """
     logger.info(
-        f"Comparison Complete - Total: {total_responses}, "
-        f"Successful: {successful_responses}, Total Time: {total_time:.2f}s"
+        "Comparison Complete - Total: %d, Successful: %d, Total Time: %.2fs",
+        total_responses, successful_responses, total_time
     )
 
 
@@ -176,31 +285,32 @@ class ModelComparisonLogger:
         self.query = query
         self.start_time = None
         self.responses = []
+        self.successful = 0
     
     def __enter__(self):
-        import time
-        self.start_time = time.time()
-        self.logger.info(f"Starting model comparison for query: '{self.query[:50]}...'")
+        self.start_time = time.perf_counter_ns()
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Starting model comparison for query: '%.50s...'", self.query)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-        total_time = time.time() - self.start_time
-        successful = len([r for r in self.responses if not r.get('error')])
-        
+        total_time = (time.perf_counter_ns() - self.start_time) / 1e9
         log_comparison_complete(
             self.logger,
             len(self.responses),
-            successful,
+            self.successful,
             total_time
         )
         
         if exc_type:
-            self.logger.error(f"Comparison failed with error: {exc_val}")
+            self.logger.error("Comparison failed with error: %s", exc_val)
     
     def add_response(self, response: dict):
         """Add a response to the logger."""
         self.responses.append(response)
+        error = response.get('error')
+        if not error:
+            self.successful += 1
         
         log_model_response(
             self.logger,
@@ -209,6 +319,6 @@ class ModelComparisonLogger:
             len(response.get('response', '')),
             response.get('token_usage', {}),
             response.get('response_time', 0),
-            success=not response.get('error'),
-            error=response.get('error')
+            success=not error,
+            error=error
         )
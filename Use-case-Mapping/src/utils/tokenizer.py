@@ -2,9 +2,55 @@
 Tokenization utilities for different model providers.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+import importlib.util
+import os
 import re
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# transformers is expensive to import, so only check for it here and load it on first use
+_TRANSFORMERS_AVAILABLE = importlib.util.find_spec('transformers') is not None
+
+_SENTENCE_RE = re.compile(r'[.!?]+')
+
+# Model-name fragment -> tokenizer, checked in order (codellama before llama)
+_HF_TOKENIZER_FAMILIES = (
+    ('codellama', 'codellama/CodeLlama-7b-hf'),
+    ('llama', 'meta-llama/Llama-2-7b-hf'),
+    ('mistral', 'mistralai/Mistral-7B-v0.1'),
+)
+
+
+@lru_cache(maxsize=8)
+def _get_openai_encoding(encoding_family: str):
+    """Build a tiktoken Encoding once per encoding family."""
+    if encoding_family == 'cl100k_base':
+        return tiktoken.get_encoding(encoding_family)
+    return tiktoken.encoding_for_model(encoding_family)
+
+
+@lru_cache(maxsize=256)
+def _hf_tokenizer_name(model_name: str) -> str:
+    """Resolve the tokenizer used to estimate tokens for a model."""
+    lowered = model_name.lower()
+    for family, tokenizer_name in _HF_TOKENIZER_FAMILIES:
+        if family in lowered:
+            return tokenizer_name
+    return 'gpt2'
+
+
+@lru_cache(maxsize=8)
+def _get_hf_tokenizer(tokenizer_name: str):
+    """Load a Hugging Face tokenizer once per process."""
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(tokenizer_name)
+
 
 class TokenizerUtils:
     """Utility class for tokenization across different providers."""
@@ -22,71 +68,69 @@ class TokenizerUtils:
         Returns:
             Estimated token count
         """
-        if provider.lower() == 'openai':
-            return TokenizerUtils._estimate_openai_tokens(text, model_name)
-        elif provider.lower() == 'anthropic':
-            return TokenizerUtils._estimate_anthropic_tokens(text, model_name)
-        elif provider.lower() == 'huggingface':
-            return TokenizerUtils._estimate_huggingface_tokens(text, model_name)
-        else:
+        estimator = TokenizerUtils._ESTIMATORS.get(provider.lower())
+        if estimator is None:
             return TokenizerUtils._basic_token_estimate(text)
+        return estimator(text, model_name)
+    
+    @staticmethod
+    def estimate_tokens_batch(texts: List[str], provider: str = 'openai', model_name: str = '') -> List[int]:
+        """
+        Estimate token counts for many texts at once.
+        
+        Tiktoken-backed providers encode the whole batch in one call, which
+        runs across a thread pool outside the GIL.
+        
+        Args:
+            texts: Texts to tokenize
+            provider: Provider name (openai, anthropic, huggingface)
+            model_name: Specific model name
+            
+        Returns:
+            Estimated token count for each text, in order
+        """
+        encoding = TokenizerUtils._get_tiktoken_encoding(provider, model_name)
+        if encoding is not None:
+            try:
+                return [len(tokens) for tokens in encoding.encode_batch(texts, num_threads=os.cpu_count() or 1)]
+            except Exception:
+                pass
+        
+        return [TokenizerUtils.estimate_tokens(text, provider, model_name) for text in texts]
     
     @staticmethod
     def _estimate_openai_tokens(text: str, model_name: str = '') -> int:
         """Estimate tokens for OpenAI models."""
-        try:
-            import tiktoken
-            
-            # Select appropriate encoding
-            if 'gpt-4' in model_name.lower():
-                encoding = tiktoken.encoding_for_model("gpt-4")
-            elif 'gpt-3.5' in model_name.lower():
-                encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
-            else:
-                encoding = tiktoken.get_encoding("cl100k_base")
-            
-            return len(encoding.encode(text))
-            
-        except ImportError:
-            # Fallback if tiktoken not available
-            return TokenizerUtils._basic_token_estimate(text)
-        except Exception:
-            return TokenizerUtils._basic_token_estimate(text)
+        return TokenizerUtils._estimate_tiktoken_tokens(text, 'openai', model_name)
     
     @staticmethod
     def _estimate_anthropic_tokens(text: str, model_name: str = '') -> int:
         """Estimate tokens for Anthropic models."""
+        # Anthropic uses similar tokenization to OpenAI
+        return TokenizerUtils._estimate_tiktoken_tokens(text, 'anthropic', model_name)
+    
+    @staticmethod
+    def _estimate_tiktoken_tokens(text: str, provider: str, model_name: str = '') -> int:
+        """Count tokens with the provider's tiktoken encoding, or estimate without one."""
+        encoding = TokenizerUtils._get_tiktoken_encoding(provider, model_name)
+        if encoding is None:
+            return TokenizerUtils._basic_token_estimate(text)
+        
         try:
-            # Anthropic uses similar tokenization to OpenAI
-            import tiktoken
-            encoding = tiktoken.get_encoding("cl100k_base")
             return len(encoding.encode(text))
-        except ImportError:
-            return TokenizerUtils._basic_token_estimate(text)
         except Exception:
             return TokenizerUtils._basic_token_estimate(text)
     
     @staticmethod
     def _estimate_huggingface_tokens(text: str, model_name: str = '') -> int:
         """Estimate tokens for Hugging Face models."""
+        if not _TRANSFORMERS_AVAILABLE:
+            return TokenizerUtils._basic_token_estimate(text)
+        
         try:
-            from transformers import AutoTokenizer
-            
-            # Select appropriate tokenizer
-            if 'llama' in model_name.lower():
-                tokenizer_name = 'meta-llama/Llama-2-7b-hf'
-            elif 'mistral' in model_name.lower():
-                tokenizer_name = 'mistralai/Mistral-7B-v0.1'
-            elif 'codellama' in model_name.lower():
-                tokenizer_name = 'codellama/CodeLlama-7b-hf'
-            else:
-                tokenizer_name = 'gpt2'
-            
-            tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+            tokenizer = _get_hf_tokenizer(_hf_tokenizer_name(model_name))
             return len(tokenizer.encode(text))
             
-        except ImportError:
-            return TokenizerUtils._basic_token_estimate(text)
         except Exception:
             return TokenizerUtils._basic_token_estimate(text)
     
@@ -103,7 +147,11 @@ class TokenizerUtils:
         """
         # Simple word-based estimation
         # Typical ratio is about 1.3 tokens per word for English
-        words = len(text.split())
+        if not text or text.isspace():
+            return 0
+        
+        # Count separators rather than splitting, so no word list is allocated
+        words = text.count(' ') + 1
         return int(words * 1.3)
     
     @staticmethod
@@ -120,8 +168,7 @@ class TokenizerUtils:
     def count_sentences(text: str) -> int:
         """Count sentences in text."""
         # Simple sentence counting using punctuation
-        sentences = re.split(r'[.!?]+', text)
-        return len([s for s in sentences if s.strip()])
+        return sum(1 for s in _SENTENCE_RE.split(text) if s.strip())
     
     @staticmethod
     def analyze_text(text: str) -> Dict[str, Any]:
@@ -134,15 +181,22 @@ class TokenizerUtils:
         Returns:
             Dictionary with text statistics
         """
+        words = text.split()
+        word_count = len(words)
+        sentence_count = TokenizerUtils.count_sentences(text)
+        
+        # Without a model name both providers resolve to cl100k_base, so encode once
+        encoded_tokens = TokenizerUtils.estimate_tokens(text, 'openai')
+        
         return {
-            'characters': TokenizerUtils.count_characters(text),
-            'words': TokenizerUtils.count_words(text),
-            'sentences': TokenizerUtils.count_sentences(text),
-            'estimated_tokens_openai': TokenizerUtils.estimate_tokens(text, 'openai'),
-            'estimated_tokens_anthropic': TokenizerUtils.estimate_tokens(text, 'anthropic'),
+            'characters': len(text),
+            'words': word_count,
+            'sentences': sentence_count,
+            'estimated_tokens_openai': encoded_tokens,
+            'estimated_tokens_anthropic': encoded_tokens,
             'estimated_tokens_basic': TokenizerUtils._basic_token_estimate(text),
-            'avg_word_length': sum(len(word) for word in text.split()) / max(len(text.split()), 1),
-            'avg_sentence_length': TokenizerUtils.count_words(text) / max(TokenizerUtils.count_sentences(text), 1)
+            'avg_word_length': sum(map(len, words)) / max(word_count, 1),
+            'avg_sentence_length': word_count / max(sentence_count, 1)
         }
     
     @staticmethod
@@ -159,16 +213,86 @@ class TokenizerUtils:
         Returns:
             Dictionary with context analysis
         """
+        # Nothing fits in an empty window, so skip tokenizing
+        if context_window <= 0:
+            return {
+                'estimated_tokens': 0,
+                'context_window': context_window,
+                'fits_in_window': False,
+                'utilization_percentage': 0,
+                'remaining_tokens': 0
+            }
+        
         estimated_tokens = TokenizerUtils.estimate_tokens(text, provider, model_name)
         
         return {
             'estimated_tokens': estimated_tokens,
             'context_window': context_window,
             'fits_in_window': estimated_tokens <= context_window,
-            'utilization_percentage': (estimated_tokens / context_window) * 100 if context_window > 0 else 0,
+            'utilization_percentage': (estimated_tokens / context_window) * 100,
             'remaining_tokens': max(0, context_window - estimated_tokens)
         }
     
+    @staticmethod
+    def _get_tiktoken_encoding(provider: str, model_name: str = ''):
+        """
+        Get the tiktoken Encoding used for a provider, if it has one.
+        
+        Returns:
+            Encoding instance, or None for providers without a tiktoken
+            encoding or when tiktoken is unavailable
+        """
+        provider = provider.lower()
+        if provider == 'openai':
+            if 'gpt-4' in model_name.lower():
+                encoding_family = "gpt-4"
+            elif 'gpt-3.5' in model_name.lower():
+                encoding_family = "gpt-3.5-turbo"
+            else:
+                encoding_family = "cl100k_base"
+        elif provider == 'anthropic':
+            encoding_family = "cl100k_base"
+        else:
+            return None
+        
+        if tiktoken is None:
+            return None
+        
+        try:
+            return _get_openai_encoding(encoding_family)
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _truncate_with_encoding(
+        text: str,
+        max_tokens: int,
+        provider: str,
+        model_name: str = ''
+    ) -> Optional[Tuple[str, int, int]]:
+        """
+        Truncate text by tokenizing it once and cutting the token array.
+        
+        Returns:
+            Tuple of (truncated text, kept token count, original token count),
+            or None if the provider has no tiktoken encoding to work with
+        """
+        encoding = TokenizerUtils._get_tiktoken_encoding(provider, model_name)
+        if encoding is None:
+            return None
+        
+        try:
+            tokens = encoding.encode(text)
+        except Exception:
+            return None
+        
+        if len(tokens) <= max_tokens:
+            return text, len(tokens), len(tokens)
+        
+        kept = tokens[:max(max_tokens, 0)]
+        # A cut inside a multi-byte character decodes to a replacement character
+        return encoding.decode(kept).rstrip('\ufffd'), len(kept), len(tokens)
+    
     @staticmethod
     def truncate_to_tokens(text: str, max_tokens: int, provider: str = 'openai', model_name: str = '') -> str:
         """
@@ -183,6 +307,10 @@ class TokenizerUtils:
         Returns:
             Truncated text
         """
+        truncated = TokenizerUtils._truncate_with_encoding(text, max_tokens, provider, model_name)
+        if truncated is not None:
+            return truncated[0]
+        
         current_tokens = TokenizerUtils.estimate_tokens(text, provider, model_name)
         
         if current_tokens <= max_tokens:
@@ -229,7 +357,13 @@ class TokenizerUtils:
         # Calculate available tokens for prompt
         available_for_prompt = min(max_prompt_tokens, context_window - max_response_tokens - 100)  # 100 token buffer
         
-        prompt_tokens = TokenizerUtils.estimate_tokens(prompt, provider, model_name)
+        # Encode once where possible; the same token array gives both counts
+        truncated = TokenizerUtils._truncate_with_encoding(prompt, available_for_prompt, provider, model_name)
+        if truncated is not None:
+            optimized_prompt, optimized_tokens, prompt_tokens = truncated
+        else:
+            optimized_prompt = None
+            prompt_tokens = TokenizerUtils.estimate_tokens(prompt, provider, model_name)
         
         if prompt_tokens <= available_for_prompt:
             return {
@@ -243,8 +377,9 @@ class TokenizerUtils:
             }
         
         # Truncate prompt
-        optimized_prompt = TokenizerUtils.truncate_to_tokens(prompt, available_for_prompt, provider, model_name)
-        optimized_tokens = TokenizerUtils.estimate_tokens(optimized_prompt, provider, model_name)
+        if optimized_prompt is None:
+            optimized_prompt = TokenizerUtils.truncate_to_tokens(prompt, available_for_prompt, provider, model_name)
+            optimized_tokens = TokenizerUtils.estimate_tokens(optimized_prompt, provider, model_name)
         
         return {
             'original_prompt': prompt,
@@ -256,3 +391,13 @@ class TokenizerUtils:
             'response_space': context_window - optimized_tokens,
             'truncation_ratio': len(optimized_prompt) / len(prompt)
         }
+
+
+# Provider-specific estimators, keyed by lower-case provider name. Built after the
+# class body so it holds plain functions rather than staticmethod objects, which are
+# not callable before Python 3.10.
+TokenizerUtils._ESTIMATORS = MappingProxyType({
+    'openai': TokenizerUtils._estimate_openai_tokens,
+    'anthropic': TokenizerUtils._estimate_anthropic_tokens,
+    'huggingface': TokenizerUtils._estimate_huggingface_tokens,
+})
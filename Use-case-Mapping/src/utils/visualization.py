@@ -6,10 +6,29 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import threading
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
+import plotly.io as pio
+
+try:
+    import orjson  # noqa: F401
+    # Serialize figures with orjson rather than the stdlib json encoder
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+
+# Numeric scores for instruction-following ratings, used in characteristics plots
+_INSTRUCTION_MAPPING = MappingProxyType({
+    'basic': 3, 'good': 5, 'very good': 7,
+    'excellent': 9, 'outstanding': 10
+})
+
+_TOKEN_LABELS = ('Input', 'Output')
 
 
 class ModelVisualizer:
@@ -23,8 +42,46 @@ class ModelVisualizer:
             theme: Color theme ('dark', 'light', 'seaborn')
         """
         self.theme = theme
+        self._single_fig = None
+        self._comparison_fig = None
+        self._table_html_cache: Dict[tuple, str] = {}
         self.setup_style()
     
+    def __del__(self):
+        """Release figures kept for reuse."""
+        for fig in (self._single_fig, self._comparison_fig):
+            if fig is not None:
+                try:
+                    plt.close(fig)
+                except Exception:
+                    # pyplot may already be torn down at interpreter exit
+                    pass
+    
+    @staticmethod
+    def _reuse_figure(fig, nrows: int, ncols: int, figsize: tuple):
+        """
+        Return a figure and its axes, clearing an existing one instead of creating a new one.
+        
+        Args:
+            fig: Previously created figure, or None
+            nrows: Number of subplot rows
+            ncols: Number of subplot columns
+            figsize: Figure size used when a new figure is created
+            
+        Returns:
+            Tuple of (figure, axes array)
+        """
+        # A figure whose window was closed has been destroyed by pyplot
+        if fig is None or not plt.fignum_exists(fig.number):
+            return plt.subplots(nrows, ncols, figsize=figsize)
+        
+        # Make it current so plt.tight_layout()/plt.show() act on the figure being drawn
+        plt.figure(fig.number)
+        axes = np.array(fig.axes).reshape(nrows, ncols)
+        for ax in axes.flat:
+            ax.clear()
+        return fig, axes
+    
     def setup_style(self):
         """Setup matplotlib and seaborn styling."""
         if self.theme == 'dark':
@@ -45,16 +102,17 @@ class ModelVisualizer:
             response: Model response dictionary
         """
         try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+            fig, axes = self._reuse_figure(self._single_fig, 2, 2, (15, 10))
+            self._single_fig = fig
+            (ax1, ax2), (ax3, ax4) = axes
             fig.suptitle(f"Model Analysis: {response.get('model_name', 'Unknown')}", fontsize=16)
             
             # Token usage breakdown
             token_usage = response.get('token_usage', {})
             if token_usage:
-                tokens = ['Input', 'Output']
                 values = [token_usage.get('input_tokens', 0), token_usage.get('output_tokens', 0)]
                 
-                ax1.pie(values, labels=tokens, autopct='%1.1f%%', startangle=90)
+                ax1.pie(values, labels=_TOKEN_LABELS, autopct='%1.1f%%', startangle=90)
                 ax1.set_title('Token Usage Distribution')
             
             # Response time vs context window
@@ -85,32 +143,51 @@ class ModelVisualizer:
         except Exception as e:
             print(f"Visualization error: {e}")
     
-    def visualize_comparison(self, results: List[Dict[str, Any]]):
+    def visualize_comparison(self, results: List[Dict[str, Any]], dashboard_file: Optional[str] = None):
         """
         Visualize comparison across multiple models.
         
         Args:
             results: List of model response dictionaries
+            dashboard_file: Write the Plotly dashboard to this HTML file instead of
+                opening it in a browser (optional)
         """
         if not results:
             print("No results to visualize")
             return
         
         try:
-            # Create interactive plotly dashboard
-            self._create_comparison_dashboard(results)
+            # Prepare data once for both views
+            df = self._prepare_comparison_dataframe(results)
+            
+            # Build and serialize the plotly dashboard in the background; matplotlib
+            # GUI backends must run on the main thread, so the plots render here
+            dashboard = threading.Thread(
+                target=self._show_dashboard,
+                args=(df, dashboard_file),
+                name='plotly-dashboard',
+                daemon=True
+            )
+            dashboard.start()
             
-            # Also create matplotlib plots
-            self._create_comparison_plots(results)
+            try:
+                # Also create matplotlib plots
+                self._create_comparison_plots(df)
+            finally:
+                dashboard.join()
             
         except Exception as e:
             print(f"Visualization error: {e}")
     
-    def _create_comparison_dashboard(self, results: List[Dict[str, Any]]):
-        """Create interactive Plotly dashboard."""
-        # Prepare data
-        df = self._prepare_comparison_dataframe(results)
-        
+    def _show_dashboard(self, df: pd.DataFrame, filename: Optional[str] = None):
+        """Create the Plotly dashboard, reporting errors instead of raising."""
+        try:
+            self._create_comparison_dashboard(df, filename)
+        except Exception as e:
+            print(f"Visualization error: {e}")
+    
+    def _create_comparison_dashboard(self, df: pd.DataFrame, filename: Optional[str] = None):
+        """Create interactive Plotly dashboard, optionally writing it to an HTML file."""
         # Create subplots
         fig = make_subplots(
             rows=2, cols=2,
@@ -126,7 +203,7 @@ class ModelVisualizer:
                 x=df['model_name'],
                 y=df['total_tokens'],
                 name='Total Tokens',
-                marker_color=df['provider'],
+                marker_color=df['provider_code'],
                 text=df['provider'],
                 textposition='auto'
             ),
@@ -135,12 +212,12 @@ class ModelVisualizer:
         
         # Response time analysis
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df['model_name'],
                 y=df['response_time'],
                 mode='markers+lines',
                 name='Response Time',
-                marker=dict(size=df['total_tokens']/50, color=df['provider']),
+                marker=dict(size=df['total_tokens']/50, color=df['provider_code']),
                 text=df['provider']
             ),
             row=1, col=2
@@ -148,14 +225,14 @@ class ModelVisualizer:
         
         # Context window vs performance
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df['context_window'],
                 y=df['total_tokens'],
                 mode='markers',
                 name='Context vs Tokens',
                 marker=dict(
                     size=df['response_time']*10,
-                    color=df['provider'],
+                    color=df['provider_code'],
                     showscale=True
                 ),
                 text=df['model_name']
@@ -179,16 +256,19 @@ class ModelVisualizer:
             title="Model Comparison Dashboard",
             height=800,
             showlegend=True,
+            hovermode='closest',
             template="plotly_dark" if self.theme == 'dark' else "plotly_white"
         )
         
-        fig.show()
+        if filename:
+            fig.write_html(filename, include_plotlyjs='cdn')
+        else:
+            fig.show()
     
-    def _create_comparison_plots(self, results: List[Dict[str, Any]]):
+    def _create_comparison_plots(self, df: pd.DataFrame):
         """Create matplotlib comparison plots."""
-        df = self._prepare_comparison_dataframe(results)
-        
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        fig, axes = self._reuse_figure(self._comparison_fig, 2, 3, (18, 12))
+        self._comparison_fig = fig
         fig.suptitle('Model Comparison Analysis', fontsize=16)
         
         # 1. Token usage by provider
@@ -200,7 +280,7 @@ class ModelVisualizer:
         
         # 2. Response time comparison
         axes[0, 1].scatter(df['total_tokens'], df['response_time'], 
-                          c=pd.Categorical(df['provider']).codes, alpha=0.7)
+                          c=df['provider_code'], alpha=0.7)
         axes[0, 1].set_title('Response Time vs Token Usage')
         axes[0, 1].set_xlabel('Total Tokens')
         axes[0, 1].set_ylabel('Response Time (s)')
@@ -216,14 +296,13 @@ class ModelVisualizer:
         axes[1, 0].set_title('Model Type Distribution')
         
         # 5. Efficiency comparison (tokens per second)
-        df['efficiency'] = df['total_tokens'] / df['response_time']
-        df_sorted = df.sort_values('efficiency')
+        df_sorted = df.assign(efficiency=df['total_tokens'] / df['response_time']).sort_values('efficiency')
         axes[1, 1].barh(df_sorted['model_name'], df_sorted['efficiency'])
         axes[1, 1].set_title('Token Generation Efficiency')
         axes[1, 1].set_xlabel('Tokens per Second')
         
         # 6. Response length distribution
-        axes[1, 2].hist([len(r.get('response', '')) for r in results], 
+        axes[1, 2].hist(df['response_length'].to_numpy(), 
                        bins=10, alpha=0.7, edgecolor='black')
         axes[1, 2].set_title('Response Length Distribution')
         axes[1, 2].set_xlabel('Response Length (characters)')
@@ -234,24 +313,37 @@ class ModelVisualizer:
     
     def _prepare_comparison_dataframe(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
         """Prepare DataFrame from results for visualization."""
-        data = []
+        # Build columns directly; pandas handles a dict of lists far faster than a list of dicts
+        columns = {
+            'provider': [],
+            'model_name': [],
+            'model_type': [],
+            'total_tokens': [],
+            'input_tokens': [],
+            'output_tokens': [],
+            'response_time': [],
+            'context_window': [],
+            'response_length': [],
+            'has_error': []
+        }
         
         for result in results:
             token_usage = result.get('token_usage', {})
-            data.append({
-                'provider': result.get('provider', 'Unknown'),
-                'model_name': result.get('model_name', 'Unknown'),
-                'model_type': result.get('model_type', 'Unknown'),
-                'total_tokens': token_usage.get('total_tokens', 0),
-                'input_tokens': token_usage.get('input_tokens', 0),
-                'output_tokens': token_usage.get('output_tokens', 0),
-                'response_time': result.get('response_time', 0),
-                'context_window': result.get('context_window', 0),
-                'response_length': len(result.get('response', '')),
-                'has_error': bool(result.get('error'))
-            })
+            columns['provider'].append(result.get('provider', 'Unknown'))
+            columns['model_name'].append(result.get('model_name', 'Unknown'))
+            columns['model_type'].append(result.get('model_type', 'Unknown'))
+            columns['total_tokens'].append(token_usage.get('total_tokens', 0))
+            columns['input_tokens'].append(token_usage.get('input_tokens', 0))
+            columns['output_tokens'].append(token_usage.get('output_tokens', 0))
+            columns['response_time'].append(result.get('response_time', 0))
+            columns['context_window'].append(result.get('context_window', 0))
+            columns['response_length'].append(len(result.get('response', '')))
+            columns['has_error'].append(bool(result.get('error')))
         
-        return pd.DataFrame(data)
+        df = pd.DataFrame(columns)
+        # Integer provider codes for coloring; plotly and matplotlib reject raw provider names
+        df['provider_code'] = pd.Categorical(df['provider']).codes
+        return df
     
     def _plot_characteristics_radar(self, ax, characteristics: Dict[str, Any]):
         """Plot model characteristics as radar chart."""
@@ -263,14 +355,9 @@ class ModelVisualizer:
             if 'context_window' in characteristics:
                 numeric_chars['Context Window'] = min(characteristics['context_window'] / 10000, 10)
             
-            instruction_mapping = {
-                'basic': 3, 'good': 5, 'very good': 7, 
-                'excellent': 9, 'outstanding': 10
-            }
-            
             if 'instruction_following' in characteristics:
                 inst_val = characteristics['instruction_following'].lower()
-                numeric_chars['Instruction Following'] = instruction_mapping.get(inst_val, 5)
+                numeric_chars['Instruction Following'] = _INSTRUCTION_MAPPING.get(inst_val, 5)
             
             # Create simple bar chart instead of radar for simplicity
             if numeric_chars:
@@ -352,13 +439,31 @@ class ModelVisualizer:
             
             <div class="comparison-table">
                 <h2>Comparison Table</h2>
-                {df.to_html(table_id='comparison-table', classes='table table-striped')}
+                {self._comparison_table_html(df.drop(columns='provider_code'))}
             </div>
         </body>
         </html>
         """
         return html
     
+    def _comparison_table_html(self, df: pd.DataFrame) -> str:
+        """Render the comparison table, reusing the HTML for identical data."""
+        try:
+            key = (tuple(df.columns), pd.util.hash_pandas_object(df).to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cell values; render without caching
+            key = None
+        
+        html = self._table_html_cache.get(key) if key is not None else None
+        if html is None:
+            html = df.to_html(table_id='comparison-table', classes='table table-striped')
+            if key is not None:
+                if len(self._table_html_cache) >= 16:
+                    self._table_html_cache.pop(next(iter(self._table_html_cache)))
+                self._table_html_cache[key] = html
+        
+        return html
+    
     def _generate_detailed_results_html(self, results: List[Dict[str, Any]]) -> str:
         """Generate detailed results HTML."""
         html_parts = []
@@ -368,6 +473,8 @@ class ModelVisualizer:
             model_name = result.get('model_name', 'Unknown')
             model_type = result.get('model_type', 'Unknown')
             response = result.get('response', 'No response')
+            # Slice only when the response is actually longer than the preview
+            preview = response if len(response) <= 500 else response[:500] + '...'
             token_usage = result.get('token_usage', {})
             
             html_parts.append(f"""
@@ -379,7 +486,7 @@ class ModelVisualizer:
                    (Input: {token_usage.get('input_tokens', 'N/A')}, Output: {token_usage.get('output_tokens', 'N/A')})</p>
                 <div class="response">
                     <h4>Response:</h4>
-                    <p>{response[:500]}{'...' if len(response) > 500 else ''}</p>
+                    <p>{preview}</p>
                 </div>
             </div>
             """)
@@ -2,8 +2,10 @@
 Basic tests for the model comparison tool.
 """
 
+import asyncio
 import pytest
 import sys
+import time
 import os
 from pathlib import Path
 
@@ -13,6 +15,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from models.model_config import load_config, validate_config
 from utils.tokenizer import TokenizerUtils
 from providers.provider_factory import ProviderFactory
+from providers.response_cache import ResponseCache
+from providers.rate_limiter import AsyncTokenBucket
 
 
 class TestModelConfig:
@@ -76,6 +80,14 @@ class TestTokenizer:
         assert TokenizerUtils.count_words(text) == 6
         assert TokenizerUtils.count_characters(text) == len(text)
         assert TokenizerUtils.count_sentences(text) == 2
+    
+    def test_estimate_tokens_batch(self):
+        """Test batch estimation matches per-text estimation."""
+        texts = ["Hello world", "This is a longer test sentence.", ""]
+        
+        for provider in ('openai', 'anthropic', 'unknown'):
+            expected = [TokenizerUtils.estimate_tokens(text, provider) for text in texts]
+            assert TokenizerUtils.estimate_tokens_batch(texts, provider) == expected
 
 
 class TestProviderFactory:
@@ -108,5 +120,95 @@ class TestProviderFactory:
         assert not factory.validate_provider_config('openai')
 
 
+
+class TestResponseCache:
+    """Test response cache functionality."""
+    
+    def test_cache_roundtrip(self, tmp_path):
+        """Test storing and retrieving a response."""
+        cache = ResponseCache(str(tmp_path / 'cache.db'))
+        key = ResponseCache.make_key('openai', 'gpt-4', 'instruct', 'Hello', 0.7, 100)
+        
+        assert cache.get(key) is None
+        cache.put(key, {'response': 'Hi'})
+        assert cache.get(key) == {'response': 'Hi'}
+        cache.close()
+    
+    def test_cache_policies(self, tmp_path):
+        """Test read-only and disabled policies."""
+        path = str(tmp_path / 'cache.db')
+        key = ResponseCache.make_key('openai', 'gpt-4', 'instruct', 'Hello', 0.7, 100)
+        
+        read_only = ResponseCache(path, policy='read_only')
+        read_only.put(key, {'response': 'Hi'})
+        assert read_only.get(key) is None
+        
+        disabled = ResponseCache.from_config({'enable_cache': False, 'cache_file': path})
+        assert not disabled.readable and not disabled.writable
+
+
+
+class TestRateLimiter:
+    """Test token bucket rate limiting."""
+    
+    def test_unlimited_by_default(self):
+        """Test that no limits means no waiting."""
+        limiter = AsyncTokenBucket()
+        assert not limiter.enabled
+        asyncio.run(limiter.acquire(10 ** 6))
+    
+    def test_requests_per_minute(self):
+        """Test that requests beyond the bucket wait for a refill."""
+        limiter = AsyncTokenBucket(rpm=600)
+        
+        async def acquire_many():
+            for _ in range(601):
+                await limiter.acquire()
+        
+        start = time.monotonic()
+        asyncio.run(acquire_many())
+        assert time.monotonic() - start >= 0.05
+
+
+class TestVisualization:
+    """Test figure reuse in the visualizer."""
+    
+    def test_reused_figures_become_current(self, monkeypatch):
+        """Test that alternating plots always draw on and show the current figure."""
+        matplotlib = pytest.importorskip('matplotlib')
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from utils.visualization import ModelVisualizer
+        
+        shown = []
+        monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: shown.append(plt.gcf()))
+        
+        visualizer = ModelVisualizer()
+        response = {
+            'provider': 'openai',
+            'model_name': 'gpt-4',
+            'model_type': 'instruct',
+            'response': 'Hello there',
+            'token_usage': {'input_tokens': 5, 'output_tokens': 7, 'total_tokens': 12},
+            'response_time': 0.5,
+            'context_window': 8192,
+        }
+        df = visualizer._prepare_comparison_dataframe([
+            response,
+            {**response, 'provider': 'anthropic', 'model_name': 'claude-2.1', 'response_time': 0.8},
+        ])
+        
+        try:
+            for _ in range(2):
+                visualizer.visualize_single_response(response)
+                assert shown[-1] is visualizer._single_fig
+                visualizer._create_comparison_plots(df)
+                assert shown[-1] is visualizer._comparison_fig
+            
+            assert visualizer._single_fig is not visualizer._comparison_fig
+        finally:
+            plt.close('all')
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -1,18 +1,29 @@
+import threading
+
+
 class ValidationError(Exception):
-    pass
+    __slots__ = ()
 
 
 class Account:
+    __slots__ = ('_account_id', '_account_holder', '_balance')
+    
     _total_accounts = 0
+    _total_accounts_lock = threading.Lock()
     _bank_name = "Default Bank"
     _minimum_balance = 0
     
     def __init__(self, account_id, account_holder, initial_balance=0):
         self._validate_account_creation(account_id, account_holder, initial_balance)
+        self._init_unchecked(account_id, account_holder, initial_balance)
+    
+    def _init_unchecked(self, account_id, account_holder, initial_balance):
+        # Field setup shared by __init__ and from_records, which validates in bulk first
         self._account_id = account_id
         self._account_holder = account_holder
         self._balance = initial_balance
-        Account._total_accounts += 1
+        with Account._total_accounts_lock:
+            Account._total_accounts += 1
     
     def _validate_account_creation(self, account_id, account_holder, initial_balance):
         if not account_id:
@@ -22,6 +33,29 @@ class Account:
         if initial_balance < self._minimum_balance:
             raise ValidationError(f"Initial balance must be at least {self._minimum_balance}")
     
+    @classmethod
+    def from_records(cls, account_ids, account_holders, initial_balances, **options):
+        account_ids = list(account_ids)
+        account_holders = list(account_holders)
+        initial_balances = list(initial_balances)
+        if not len(account_ids) == len(account_holders) == len(initial_balances):
+            raise ValidationError("Account records must all have the same length")
+        
+        # Validate whole columns at once, then build accounts without per-row checks
+        if not all(account_ids):
+            raise ValidationError("Account ID cannot be empty")
+        if not all(account_holders):
+            raise ValidationError("Account holder name cannot be empty")
+        if initial_balances and min(initial_balances) < cls._minimum_balance:
+            raise ValidationError(f"Initial balance must be at least {cls._minimum_balance}")
+        
+        accounts = []
+        for account_id, account_holder, initial_balance in zip(account_ids, account_holders, initial_balances):
+            account = cls.__new__(cls)
+            account._init_unchecked(account_id, account_holder, initial_balance, **options)
+            accounts.append(account)
+        return accounts
+    
     @property
     def account_id(self):
         return self._account_id
@@ -75,8 +109,14 @@ class Account:
 
 
 class SavingsAccount(Account):
+    __slots__ = ('_interest_rate',)
+    
     def __init__(self, account_id, account_holder, initial_balance=0, interest_rate=2.5):
-        super().__init__(account_id, account_holder, initial_balance)
+        self._validate_account_creation(account_id, account_holder, initial_balance)
+        self._init_unchecked(account_id, account_holder, initial_balance, interest_rate)
+    
+    def _init_unchecked(self, account_id, account_holder, initial_balance, interest_rate=2.5):
+        super()._init_unchecked(account_id, account_holder, initial_balance)
         self._interest_rate = interest_rate
     
     @property
@@ -98,8 +138,14 @@ class SavingsAccount(Account):
 
 
 class CheckingAccount(Account):
+    __slots__ = ('_overdraft_limit',)
+    
     def __init__(self, account_id, account_holder, initial_balance=0, overdraft_limit=200):
-        super().__init__(account_id, account_holder, initial_balance)
+        self._validate_account_creation(account_id, account_holder, initial_balance)
+        self._init_unchecked(account_id, account_holder, initial_balance, overdraft_limit)
+    
+    def _init_unchecked(self, account_id, account_holder, initial_balance, overdraft_limit=200):
+        super()._init_unchecked(account_id, account_holder, initial_balance)
         self._overdraft_limit = overdraft_limit
     
     @property
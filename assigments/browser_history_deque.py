@@ -1,35 +1,59 @@
-from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+
+# __slots__ is written out because dataclass(slots=True) needs Python 3.10+
+@dataclass(frozen=True)
+class BrowserState:
+    __slots__ = ('current_page', 'history', 'forward_stack')
+    
+    current_page: Optional[str]
+    history: tuple
+    forward_stack: tuple
+
 
 class BrowserHistory:
     def __init__(self, max_size=5):
-        self.history = deque(maxlen=max_size)
-        self.forward_stack = deque()
+        # Back and forward pages share one list; cursor marks the current page
+        self.pages = []
+        self.cursor = -1
         self.max_size = max_size
     
     def add_new_page(self, url):
-        self.history.append(url)
-        self.forward_stack.clear()
+        del self.pages[self.cursor + 1:]
+        self.pages.append(url)
+        if len(self.pages) > self.max_size:
+            del self.pages[0]
+        self.cursor = len(self.pages) - 1
     
     def go_back(self):
-        if len(self.history) > 1:
-            page = self.history.pop()
-            self.forward_stack.append(page)
-            return self.history[-1] if self.history else None
+        if self.cursor > 0:
+            self.cursor -= 1
+            return self.pages[self.cursor]
         return None
     
     def go_forward(self):
-        if self.forward_stack:
-            page = self.forward_stack.pop()
-            self.history.append(page)
-            return page
+        if self.cursor < len(self.pages) - 1:
+            self.cursor += 1
+            return self.pages[self.cursor]
         return None
     
+    @property
+    def current_page(self):
+        return self.pages[self.cursor] if self.pages else None
+    
+    def snapshot(self):
+        return BrowserState(
+            current_page=self.current_page,
+            history=tuple(self.pages[:self.cursor + 1]),
+            forward_stack=tuple(self.pages[:self.cursor:-1])
+        )
+    
     def get_current_state(self):
-        current_page = self.history[-1] if self.history else None
         return {
-            'current_page': current_page,
-            'history': list(self.history),
-            'forward_stack': list(self.forward_stack)
+            'current_page': self.current_page,
+            'history': self.pages[:self.cursor + 1],
+            'forward_stack': self.pages[:self.cursor:-1]
         }
 
 if __name__ == "__main__":
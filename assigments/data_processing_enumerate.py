@@ -10,10 +10,10 @@ for student, score in zip(students, scores):
     print(f"{student}: {score}")
 
 print("\n3. Positions of High Scorers (above 90):")
-high_scorer_positions = [i for i, score in enumerate(scores) if score > 90]
-for pos in high_scorer_positions:
-    print(f"Position {pos}: {students[pos]} scored {scores[pos]}")
+high_scorers = [(pos, student, score) for pos, (student, score) in enumerate(zip(students, scores)) if score > 90]
+for pos, student, score in high_scorers:
+    print(f"Position {pos}: {student} scored {score}")
 
 print("\n4. Position to Student Name Dictionary:")
-position_to_name = {i: student for i, student in enumerate(students)}
+position_to_name = dict(enumerate(students))
 print(position_to_name)
@@ -1,24 +1,18 @@
-import random
+import numpy as np
 
-count_sum_7 = 0
-count_sum_2 = 0
-count_sum_greater_10 = 0
+NUM_TRIALS = 10000
 
-for _ in range(10000):
-    dice1 = random.randint(1, 6)
-    dice2 = random.randint(1, 6)
-    dice_sum = dice1 + dice2
-    
-    if dice_sum == 7:
-        count_sum_7 += 1
-    elif dice_sum == 2:
-        count_sum_2 += 1
-    elif dice_sum > 10:
-        count_sum_greater_10 += 1
+rng = np.random.default_rng()
+dice = rng.integers(1, 7, size=(NUM_TRIALS, 2))
+dice_sum = dice.sum(axis=1)
 
-prob_sum_7 = count_sum_7 / 10000
-prob_sum_2 = count_sum_2 / 10000
-prob_sum_greater_10 = count_sum_greater_10 / 10000
+count_sum_7 = int((dice_sum == 7).sum())
+count_sum_2 = int((dice_sum == 2).sum())
+count_sum_greater_10 = int((dice_sum > 10).sum())
+
+prob_sum_7 = count_sum_7 / NUM_TRIALS
+prob_sum_2 = count_sum_2 / NUM_TRIALS
+prob_sum_greater_10 = count_sum_greater_10 / NUM_TRIALS
 
 print(f"P(Sum = 7): {prob_sum_7:.4f}")
 print(f"P(Sum = 2): {prob_sum_2:.4f}")
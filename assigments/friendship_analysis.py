@@ -1,30 +1,25 @@
+from collections import Counter
+from itertools import chain
+
+
 def analyze_friendships():
     facebook_friends = {"alice", "bob", "charlie", "diana", "eve", "frank"}
     instagram_friends = {"bob", "charlie", "grace", "henry", "alice", "ivan"}
     twitter_friends = {"alice", "diana", "grace", "jack", "bob", "karen"}
     linkedin_friends = {"charlie", "diana", "frank", "grace", "luke", "mary"}
     
-    all_platforms = facebook_friends & instagram_friends & twitter_friends & linkedin_friends
+    # One pass over every membership gives each friend's platform count
+    platform_counts = Counter(chain(facebook_friends, instagram_friends, twitter_friends, linkedin_friends))
+    
+    all_platforms = {friend for friend, count in platform_counts.items() if count == 4}
     
     facebook_only = facebook_friends - instagram_friends - twitter_friends - linkedin_friends
     
-    instagram_xor_twitter = (instagram_friends | twitter_friends) - (instagram_friends & twitter_friends)
+    instagram_xor_twitter = instagram_friends ^ twitter_friends
     
-    total_unique = facebook_friends | instagram_friends | twitter_friends | linkedin_friends
+    total_unique = set(platform_counts)
     
-    exactly_two_platforms = set()
-    for friend in total_unique:
-        count = 0
-        if friend in facebook_friends:
-            count += 1
-        if friend in instagram_friends:
-            count += 1
-        if friend in twitter_friends:
-            count += 1
-        if friend in linkedin_friends:
-            count += 1
-        if count == 2:
-            exactly_two_platforms.add(friend)
+    exactly_two_platforms = {friend for friend, count in platform_counts.items() if count == 2}
     
     return {
         'all_platforms': all_platforms,
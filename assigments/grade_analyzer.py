@@ -1,3 +1,5 @@
+import heapq
+
 grades = [85, 92, 78, 90, 88, 76, 94, 89, 87, 91]
 
 sliced_grades = grades[2:8]
@@ -12,6 +14,5 @@ print(f"After replacing grade at index 3 with 95: {grades}")
 grades.extend([93, 96, 88])
 print(f"After appending three new grades: {grades}")
 
-sorted_grades = sorted(grades, reverse=True)
-top_5_grades = sorted_grades[:5]
+top_5_grades = heapq.nlargest(5, grades)
 print(f"Top 5 grades in descending order: {top_5_grades}")
@@ -1,38 +1,55 @@
-from collections import defaultdict
+import heapq
+from itertools import chain
+from operator import itemgetter
 
 class GradeManager:
     def __init__(self):
-        self.grade_manager = defaultdict(lambda: defaultdict(list))
+        self.grade_manager = {}
+        self._averages = None
     
     def add_grade(self, student_name, subject, grade):
-        self.grade_manager[student_name][subject].append(grade)
+        self.grade_manager.setdefault(student_name, {}).setdefault(subject, []).append(grade)
+        self._averages = None
+    
+    def _compute_all_averages(self):
+        # Averages are computed once and reused until the next add_grade
+        if self._averages is None:
+            averages = {}
+            for student, subjects in self.grade_manager.items():
+                grades = list(chain.from_iterable(subjects.values()))
+                averages[student] = sum(grades) / len(grades) if grades else 0
+            self._averages = averages
+        return self._averages
     
     def get_student_average(self, student_name):
-        if student_name not in self.grade_manager:
+        averages = self._compute_all_averages()
+        if student_name not in averages:
             return f"Student {student_name} not found"
         
-        total_grades = []
-        for subject in self.grade_manager[student_name]:
-            total_grades.extend(self.grade_manager[student_name][subject])
-        
-        if not total_grades:
-            return 0
-        
-        return sum(total_grades) / len(total_grades)
+        return averages[student_name]
     
     def get_subject_statistics(self, subject):
-        all_grades = []
-        for student in self.grade_manager:
-            if subject in self.grade_manager[student]:
-                all_grades.extend(self.grade_manager[student][subject])
+        total = 0
+        count = 0
+        highest = float('-inf')
+        lowest = float('inf')
+        student_count = 0
+        for subjects in self.grade_manager.values():
+            if subject not in subjects:
+                continue
+            student_count += 1
+            for grade in subjects[subject]:
+                total += grade
+                count += 1
+                if grade > highest:
+                    highest = grade
+                if grade < lowest:
+                    lowest = grade
         
-        if not all_grades:
+        if not count:
             return f"No grades found for subject {subject}"
         
-        average = sum(all_grades) / len(all_grades)
-        highest = max(all_grades)
-        lowest = min(all_grades)
-        student_count = sum(1 for student in self.grade_manager if subject in self.grade_manager[student])
+        average = total / count
         
         return {
             "subject": subject,
@@ -43,23 +60,14 @@ class GradeManager:
         }
     
     def get_top_students(self, n=3):
-        student_averages = []
-        for student in self.grade_manager:
-            avg = self.get_student_average(student)
-            if isinstance(avg, (int, float)):
-                student_averages.append((student, avg))
-        
-        student_averages.sort(key=lambda x: x[1], reverse=True)
-        return student_averages[:n]
+        return heapq.nlargest(n, self._compute_all_averages().items(), key=itemgetter(1))
     
     def get_failing_students(self, passing_grade=60):
-        failing_students = []
-        for student in self.grade_manager:
-            avg = self.get_student_average(student)
-            if isinstance(avg, (int, float)) and avg < passing_grade:
-                failing_students.append((student, avg))
-        
-        failing_students.sort(key=lambda x: x[1])
+        failing_students = [
+            (student, avg) for student, avg in self._compute_all_averages().items()
+            if avg < passing_grade
+        ]
+        failing_students.sort(key=itemgetter(1))
         return failing_students
 
 manager = GradeManager()
@@ -1,45 +1,61 @@
-inventory = {
-    "apples": {"price": 1.50, "quantity": 100},
-    "bananas": {"price": 0.75, "quantity": 150},
-    "oranges": {"price": 2.00, "quantity": 80}
-}
+import sys
+
+import numpy as np
+
+# Struct-of-arrays store: product i has name names[i], price prices[i], quantity quantities[i]
+names = []
+name_to_idx = {}
+prices = np.empty(0, dtype=float)
+quantities = np.empty(0, dtype=np.int64)
 
 def add_product(name, price, quantity):
-    inventory[name] = {"price": price, "quantity": quantity}
+    global prices, quantities
+    if name in name_to_idx:
+        idx = name_to_idx[name]
+        prices[idx] = price
+        quantities[idx] = quantity
+        return
+    name_to_idx[name] = len(names)
+    names.append(name)
+    prices = np.append(prices, price)
+    quantities = np.append(quantities, quantity)
 
 def update_price(product_name, new_price):
-    if product_name in inventory:
-        inventory[product_name]["price"] = new_price
+    idx = name_to_idx.get(product_name)
+    if idx is not None:
+        prices[idx] = new_price
 
 def sell_product(product_name, quantity_sold):
-    if product_name in inventory and inventory[product_name]["quantity"] >= quantity_sold:
-        inventory[product_name]["quantity"] -= quantity_sold
+    idx = name_to_idx.get(product_name)
+    if idx is not None and quantities[idx] >= quantity_sold:
+        quantities[idx] -= quantity_sold
 
 def calculate_total_value():
-    total = 0
-    for product in inventory:
-        total += inventory[product]["price"] * inventory[product]["quantity"]
-    return total
+    return float(prices @ quantities)
 
 def find_low_stock_products(threshold=100):
-    low_stock = []
-    for product in inventory:
-        if inventory[product]["quantity"] < threshold:
-            low_stock.append(product)
-    return low_stock
+    return [names[i] for i in np.flatnonzero(quantities < threshold)]
+
+add_product("apples", 1.50, 100)
+add_product("bananas", 0.75, 150)
+add_product("oranges", 2.00, 80)
 
 add_product("grapes", 3.25, 60)
 update_price("bananas", 0.80)
 sell_product("apples", 25)
 
-print("Current Inventory:")
-for product, details in inventory.items():
-    print(f"{product}: Price=${details['price']:.2f}, Quantity={details['quantity']}")
+out = ["Current Inventory:"]
+out.extend(
+    f"{name}: Price=${price:.2f}, Quantity={quantity}"
+    for name, price, quantity in zip(names, prices, quantities)
+)
 
-print(f"\nTotal Inventory Value: ${calculate_total_value():.2f}")
+out.append(f"\nTotal Inventory Value: ${calculate_total_value():.2f}")
 
 low_stock = find_low_stock_products()
 if low_stock:
-    print(f"\nLow Stock Products: {', '.join(low_stock)}")
+    out.append(f"\nLow Stock Products: {', '.join(low_stock)}")
 else:
-    print("\nNo low stock products")
+    out.append("\nNo low stock products")
+
+sys.stdout.write("\n".join(out) + "\n")
@@ -3,8 +3,11 @@ fruits_tuple = ("apple", "banana", "orange")
 fruits_set = {"apple", "banana", "orange", "grape"}
 fruits_dict = {"apple": 5, "banana": 3, "orange": 8, "grape": 2}
 
+# Built once so repeated membership tests against the list's contents are hash lookups
+fruits_list_lookup = frozenset(fruits_list)
+
 print("1. Check for Membership")
-print(f"'apple' in fruits_list: {'apple' in fruits_list}")
+print(f"'apple' in fruits_list: {'apple' in fruits_list_lookup}")
 print(f"'apple' in fruits_tuple: {'apple' in fruits_tuple}")
 print(f"'apple' in fruits_set: {'apple' in fruits_set}")
 print(f"'apple' in fruits_dict: {'apple' in fruits_dict}")
@@ -1,31 +1,60 @@
+from operator import mul
+
+import numpy as np
+
+
+def _vector_uses_numpy(v):
+    # Arrays and float vectors go through BLAS; plain integer lists stay exact and skip conversion
+    return isinstance(v, np.ndarray) or (len(v) > 0 and isinstance(v[0], float))
+
+
 def dot_product(a, b):
     if len(a) != len(b):
         raise ValueError("Vectors must have the same length")
-    return sum(x * y for x, y in zip(a, b))
+    
+    if _vector_uses_numpy(a) or _vector_uses_numpy(b):
+        a_arr = np.asarray(a)
+        b_arr = np.asarray(b)
+        if a_arr.shape != b_arr.shape:
+            raise ValueError("Vectors must have the same length")
+        result = np.dot(a_arr, b_arr)
+        return result.item() if isinstance(result, np.generic) else result
+    
+    return sum(map(mul, a, b))
+
+
+def batched_dot(A, B):
+    # Row-wise dot products over the last axis, without materializing A * B
+    return np.einsum('...i,...i->...', np.asarray(A), np.asarray(B))
+
+
+def _matrix_uses_numpy(M):
+    return isinstance(M, np.ndarray) or (len(M) > 0 and _vector_uses_numpy(M[0]))
 
 
 def matrix_multiply(A, B):
     if len(A[0]) != len(B):
         raise ValueError("Number of columns in A must equal number of rows in B")
     
-    result = []
-    for i in range(len(A)):
-        row = []
-        for j in range(len(B[0])):
-            element = sum(A[i][k] * B[k][j] for k in range(len(B)))
-            row.append(element)
-        result.append(row)
-    return result
+    if _matrix_uses_numpy(A) or _matrix_uses_numpy(B):
+        return (np.asarray(A) @ np.asarray(B)).tolist()
+    
+    # Integer lists: exact Python arithmetic over B's columns, transposed once
+    B_columns = list(zip(*B))
+    return [[sum(map(mul, row, column)) for column in B_columns] for row in A]
 
 
 def conditional_probability(events):
+    # Only arrays are counted with NumPy; other sequences use each event's truthiness
+    if isinstance(events, np.ndarray):
+        if events.size == 0:
+            return 0.0
+        return float(np.count_nonzero(events) / events.size)
+    
     if not events:
         return 0.0
     
-    total_events = len(events)
-    favorable_events = sum(1 for event in events if event)
-    
-    return favorable_events / total_events
+    return float(sum(map(bool, events)) / len(events))
 
 
 if __name__ == "__main__":
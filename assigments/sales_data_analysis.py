@@ -1,3 +1,5 @@
+import sys
+
 sales_data = [
     ("Q1", [("Jan", 1000), ("Feb", 1200), ("Mar", 1100)]),
     ("Q2", [("Apr", 1300), ("May", 1250), ("Jun", 1400)]),
@@ -5,23 +7,23 @@ sales_data = [
 ]
 
 total_sales_per_quarter = []
+flat_monthly_sales = []
+highest_month = ("", float("-inf"))
 for quarter, months in sales_data:
-    total = sum(sales for month, sales in months)
-    total_sales_per_quarter.append((quarter, total))
-    print(f"{quarter}: {total}")
-
-all_monthly_sales = []
-for quarter, months in sales_data:
+    total = 0
     for month, sales in months:
-        all_monthly_sales.append((month, sales))
-
-highest_month = max(all_monthly_sales, key=lambda x: x[1])
-print(f"Highest sales month: {highest_month[0]} with {highest_month[1]} sales")
+        flat_monthly_sales.append((month, sales))
+        total += sales
+        if sales > highest_month[1]:
+            highest_month = (month, sales)
+    total_sales_per_quarter.append((quarter, total))
 
-flat_monthly_sales = [(month, sales) for quarter, months in sales_data for month, sales in months]
-print("Flat list of monthly sales:", flat_monthly_sales)
+out = [f"{quarter}: {total}" for quarter, total in total_sales_per_quarter]
+out.append(f"Highest sales month: {highest_month[0]} with {highest_month[1]} sales")
+out.append(f"Flat list of monthly sales: {flat_monthly_sales}")
 
 for quarter, months in sales_data:
-    print(f"\n{quarter}:")
-    for month, sales in months:
-        print(f"  {month}: {sales}")
+    out.append(f"\n{quarter}:")
+    out.extend(f"  {month}: {sales}" for month, sales in months)
+
+sys.stdout.write("\n".join(out) + "\n")
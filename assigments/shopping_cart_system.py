@@ -1,3 +1,6 @@
+from collections import Counter
+
+
 class Product:
     def __init__(self, product_id, name, price, category, stock_quantity):
         self.product_id = product_id
@@ -35,17 +38,15 @@ class ShoppingCart:
     def __init__(self, customer):
         self.customer = customer
         self.cart_items = {}
+        self._dirty = True
+        self._aggregate_cache = (0, 0)
     
     def add_item(self, product, quantity):
         if product.stock_quantity >= quantity:
-            if product.product_id in self.cart_items:
-                self.cart_items[product.product_id]['quantity'] += quantity
-            else:
-                self.cart_items[product.product_id] = {
-                    'product': product,
-                    'quantity': quantity
-                }
+            entry = self.cart_items.setdefault(product.product_id, {'product': product, 'quantity': 0})
+            entry['quantity'] += quantity
             product.stock_quantity -= quantity
+            self._dirty = True
             return True
         return False
     
@@ -54,14 +55,27 @@ class ShoppingCart:
             item = self.cart_items[product_id]
             item['product'].stock_quantity += item['quantity']
             del self.cart_items[product_id]
+            self._dirty = True
             return True
         return False
     
+    def _aggregate(self):
+        # Item count and subtotal in one pass, reused until the cart changes
+        if self._dirty:
+            total_items = 0
+            subtotal = 0
+            for item in self.cart_items.values():
+                total_items += item['quantity']
+                subtotal += item['product'].price * item['quantity']
+            self._aggregate_cache = (total_items, subtotal)
+            self._dirty = False
+        return self._aggregate_cache
+    
     def get_total_items(self):
-        return sum(item['quantity'] for item in self.cart_items.values())
+        return self._aggregate()[0]
     
     def get_subtotal(self):
-        return sum(item['product'].price * item['quantity'] for item in self.cart_items.values())
+        return self._aggregate()[1]
     
     def calculate_total(self):
         subtotal = self.get_subtotal()
@@ -73,12 +87,14 @@ class ShoppingCart:
         for item in self.cart_items.values():
             item['product'].stock_quantity += item['quantity']
         self.cart_items.clear()
+        self._dirty = True
     
     def get_cart_items(self):
         return list(self.cart_items.values())
 
 class Product:
     products = []
+    _category_counts = Counter()
     
     def __init__(self, product_id, name, price, category, stock_quantity):
         self.product_id = product_id
@@ -87,6 +103,7 @@ class Product:
         self.category = category
         self.stock_quantity = stock_quantity
         Product.products.append(self)
+        Product._category_counts[category] += 1
     
     def get_product_info(self):
         return f"Product: {self.name}, Price: ${self.price}, Category: {self.category}, Stock: {self.stock_quantity}"
@@ -97,12 +114,9 @@ class Product:
     
     @classmethod
     def get_most_popular_category(cls):
-        if not cls.products:
+        if not cls._category_counts:
             return None
-        categories = {}
-        for product in cls.products:
-            categories[product.category] = categories.get(product.category, 0) + 1
-        return max(categories, key=categories.get)
+        return cls._category_counts.most_common(1)[0][0]
 
 laptop = Product("P001", "Gaming Laptop", 999.99, "Electronics", 10)
 book = Product("P002", "Python Programming", 49.99, "Books", 25)
@@ -28,18 +28,21 @@ def top_posts_by_likes(posts):
 
 def user_activity_summary(posts, users):
     user_summary = {}
-    user_likes = user_engagement_analysis(posts)
-    user_posts = defaultdict(int)
     
+    # One pass tallies [total_likes, posts_count] per user
+    user_stats = defaultdict(lambda: [0, 0])
     for post in posts:
-        user_posts[post["user"]] += 1
+        stats = user_stats[post["user"]]
+        stats[0] += post["likes"]
+        stats[1] += 1
     
-    for user in users:
+    for user, profile in users.items():
+        total_likes, posts_count = user_stats.get(user, (0, 0))
         summary = {
-            "posts_count": user_posts.get(user, 0),
-            "total_likes": user_likes.get(user, 0),
-            "followers": users[user]["followers"],
-            "following": users[user]["following"]
+            "posts_count": posts_count,
+            "total_likes": total_likes,
+            "followers": profile["followers"],
+            "following": profile["following"]
         }
         user_summary[user] = summary
     
@@ -1,45 +1,80 @@
 from collections import Counter
 import re
 import string
+import sys
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENT_RE = re.compile(r'[.!?]+')
+
+def _byte_class(byte):
+    char = chr(byte)
+    if char.isalpha():
+        kind = 'v' if char in 'aeiouAEIOU' else 'c'
+        return kind.upper() if char.isupper() else kind
+    if char.isdigit():
+        return 'D'
+    if char in string.punctuation:
+        return 'P'
+    if char.isspace():
+        return 'S'
+    return '.'
+
+# Maps every ASCII byte to its class: V/v vowel, C/c consonant (upper/lower), D digit, P punctuation, S whitespace
+_CLASS_TABLE = bytes.maketrans(bytes(range(128)), ''.join(_byte_class(b) for b in range(128)).encode('ascii'))
 
 def analyze_text(text):
+    return _analyze(text)[0]
+
+def _analyze(text):
     if not text:
-        return {}
+        return {}, Counter()
     
     text_lower = text.lower()
     
-    chars = list(text)
-    char_count = len(chars)
+    char_count = len(text)
     
-    words = re.findall(r'\b\w+\b', text_lower)
+    words = _WORD_RE.findall(text_lower)
     word_count = len(words)
     
-    sentences = re.split(r'[.!?]+', text.strip())
+    sentences = _SENT_RE.split(text.strip())
     sentences = [s for s in sentences if s.strip()]
     sentence_count = len(sentences)
     
     paragraphs = [p for p in text.split('\n\n') if p.strip()]
     paragraph_count = len(paragraphs)
     
-    vowels = 'aeiou'
-    vowel_count = sum(1 for char in text_lower if char in vowels)
-    consonant_count = sum(1 for char in text_lower if char.isalpha() and char not in vowels)
-    
+    # Classify distinct characters from two counters instead of scanning the text per class
     char_frequency = Counter(text_lower)
     word_frequency = Counter(words)
     
+    if text.isascii():
+        # One C-level translate pass labels every byte; counting the labels gives each class
+        classes = text.encode('ascii').translate(_CLASS_TABLE)
+        upper_vowels, lower_vowels = classes.count(b'V'), classes.count(b'v')
+        upper_consonants, lower_consonants = classes.count(b'C'), classes.count(b'c')
+        vowel_count = upper_vowels + lower_vowels
+        consonant_count = upper_consonants + lower_consonants
+        punctuation_count = classes.count(b'P')
+        digit_count = classes.count(b'D')
+        uppercase_count = upper_vowels + upper_consonants
+        lowercase_count = lower_vowels + lower_consonants
+        whitespace_count = classes.count(b'S')
+    else:
+        case_frequency = Counter(text)
+        vowel_count = sum(char_frequency[char] for char in 'aeiou')
+        consonant_count = sum(count for char, count in char_frequency.items() if char.isalpha()) - vowel_count
+        punctuation_count = sum(case_frequency[char] for char in string.punctuation)
+        digit_count = sum(count for char, count in case_frequency.items() if char.isdigit())
+        uppercase_count = sum(count for char, count in case_frequency.items() if char.isupper())
+        lowercase_count = sum(count for char, count in case_frequency.items() if char.islower())
+        whitespace_count = sum(count for char, count in case_frequency.items() if char.isspace())
+    
     most_common_char = char_frequency.most_common(1)[0] if char_frequency else ('', 0)
     most_common_word = word_frequency.most_common(1)[0] if word_frequency else ('', 0)
     
     unique_words = len(set(words))
     unique_chars = len(set(text_lower))
     
-    punctuation_count = sum(1 for char in text if char in string.punctuation)
-    digit_count = sum(1 for char in text if char.isdigit())
-    uppercase_count = sum(1 for char in text if char.isupper())
-    lowercase_count = sum(1 for char in text if char.islower())
-    whitespace_count = sum(1 for char in text if char.isspace())
-    
     avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
     avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
     
@@ -63,24 +98,25 @@ def analyze_text(text):
         'most_common_word': most_common_word,
         'character_frequency': dict(char_frequency.most_common(10)),
         'word_frequency': dict(word_frequency.most_common(10))
-    }
+    }, word_frequency
 
 def get_word_frequency_with_length(text, length=None):
-    words = re.findall(r'\b\w+\b', text.lower())
+    words = _WORD_RE.findall(text.lower())
     if length:
         words = [word for word in words if len(word) == length]
     return Counter(words)
 
 def find_common_words_between_texts(text1, text2):
-    words1 = set(re.findall(r'\b\w+\b', text1.lower()))
-    words2 = set(re.findall(r'\b\w+\b', text2.lower()))
+    words1 = set(_WORD_RE.findall(text1.lower()))
+    words2 = set(_WORD_RE.findall(text2.lower()))
     return words1.intersection(words2)
 
 def compare_with_statistics(text, other_text):
-    stats1 = analyze_text(text)
-    stats2 = analyze_text(other_text)
+    stats1, word_frequency1 = _analyze(text)
+    stats2, word_frequency2 = _analyze(other_text)
     
-    common_words = find_common_words_between_texts(text, other_text)
+    # The full word counters already hold each text's vocabulary; no need to re-tokenize
+    common_words = word_frequency1.keys() & word_frequency2.keys()
     
     similarity_score = len(common_words) / max(stats1['unique_words'], stats2['unique_words']) if max(stats1['unique_words'], stats2['unique_words']) > 0 else 0
     
@@ -103,27 +139,27 @@ def main():
     
     analysis = analyze_text(sample_text)
     
-    print("Text Analysis Results:")
-    print("=" * 50)
+    out = ["Text Analysis Results:", "=" * 50]
     for key, value in analysis.items():
         if isinstance(value, dict):
-            print(f"{key.replace('_', ' ').title()}:")
-            for k, v in value.items():
-                print(f"  {k}: {v}")
+            out.append(f"{key.replace('_', ' ').title()}:")
+            out.extend(f"  {k}: {v}" for k, v in value.items())
         else:
-            print(f"{key.replace('_', ' ').title()}: {value}")
+            out.append(f"{key.replace('_', ' ').title()}: {value}")
     
-    print("\n" + "=" * 50)
-    print("Word frequency by length (3 characters):")
+    out.append("\n" + "=" * 50)
+    out.append("Word frequency by length (3 characters):")
     length_freq = get_word_frequency_with_length(sample_text, 3)
-    for word, count in length_freq.most_common(5):
-        print(f"{word}: {count}")
+    out.extend(f"{word}: {count}" for word, count in length_freq.most_common(5))
     
     other_text = "This is another sample text. It has some common words with the first text."
     comparison = compare_with_statistics(sample_text, other_text)
     
-    print(f"\nCommon words between texts: {comparison['common_words']}")
-    print(f"Similarity score: {comparison['similarity_score']}")
+    out.append(f"\nCommon words between texts: {comparison['common_words']}")
+    out.append(f"Similarity score: {comparison['similarity_score']}")
+    
+    # Emit the whole report with one write instead of a print per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,10 @@
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def add_vectors(a, b):
     return [a[i] + b[i] for i in range(len(a))]
 
@@ -7,19 +14,35 @@ def dot_product(a, b):
 def are_orthogonal(a, b):
     return dot_product(a, b) == 0
 
-def multiply_matrices(A, B):
-    rows_A = len(A)
-    cols_A = len(A[0])
-    cols_B = len(B[0])
+def _multiply_matrices_python(A, B):
+    if len(A[0]) != len(B):
+        raise ValueError("Number of columns in A must equal number of rows in B")
     
-    result = [[0 for _ in range(cols_B)] for _ in range(rows_A)]
+    # Transpose B once so each entry is a sequential row-by-column dot product
+    B_columns = list(zip(*B))
+    return [[sum(map(mul, row, column)) for column in B_columns] for row in A]
+
+def _matrix_uses_numpy(M):
+    # Arrays and float matrices go through BLAS; plain integer lists stay exact and skip conversion
+    if np is None:
+        return False
+    if isinstance(M, np.ndarray):
+        return True
+    if not M:
+        return False
+    row = M[0]
+    return isinstance(row, np.ndarray) or (len(row) > 0 and isinstance(row[0], float))
+
+def multiply_matrices(A, B):
+    if not (_matrix_uses_numpy(A) or _matrix_uses_numpy(B)):
+        return _multiply_matrices_python(A, B)
     
-    for i in range(rows_A):
-        for j in range(cols_B):
-            for k in range(cols_A):
-                result[i][j] += A[i][k] * B[k][j]
+    A_np = np.asarray(A)
+    B_np = np.asarray(B)
+    if A_np.shape[1] != B_np.shape[0]:
+        raise ValueError("Number of columns in A must equal number of rows in B")
     
-    return result
+    return (A_np @ B_np).tolist()
 
 if __name__ == "__main__":
     a = [1, 2, 3]
@@ -2,7 +2,8 @@ monday_visitors = {"user1", "user2", "user3", "user4", "user5"}
 tuesday_visitors = {"user2", "user4", "user6", "user7", "user8"}
 wednesday_visitors = {"user1", "user3", "user6", "user9", "user10"}
 
-unique_visitors = monday_visitors | tuesday_visitors | wednesday_visitors
+monday_tuesday_visitors = monday_visitors | tuesday_visitors
+unique_visitors = monday_tuesday_visitors | wednesday_visitors
 print(f"Total unique visitors across all days: {len(unique_visitors)}")
 
 returning_tuesday = monday_visitors & tuesday_visitors
@@ -10,7 +11,7 @@ print(f"Returning visitors on Tuesday: {returning_tuesday}")
 
 new_monday = monday_visitors
 new_tuesday = tuesday_visitors - monday_visitors
-new_wednesday = wednesday_visitors - (monday_visitors | tuesday_visitors)
+new_wednesday = wednesday_visitors - monday_tuesday_visitors
 print(f"New visitors Monday: {new_monday}")
 print(f"New visitors Tuesday: {new_tuesday}")
 print(f"New visitors Wednesday: {new_wednesday}")
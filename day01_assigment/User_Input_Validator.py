@@ -1,9 +1,11 @@
 try:
     user_input = input("Enter Your age: ")
-    if not user_input.isdigit():
+    # isdecimal() rejects signs, spaces and underscores that int() would accept,
+    # so the single int() parse below cannot fail
+    if not user_input.isdecimal():
         raise ValueError("Invalid input: Please enter a valid age.")
     user_input = int(user_input)
     if user_input <= 0:
         raise ValueError("Invalid input: Age must be a positive integer.")
 except ValueError as e:
-    print(e)
\ No newline at end of file
+    print(e)
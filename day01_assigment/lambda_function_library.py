@@ -2,33 +2,39 @@ import math
 
 square = lambda x: x * x
 
-factorial = lambda n: math.factorial(n)
+factorial = math.factorial
 
 reverse = lambda s: s[::-1]
 
-uppercase = lambda s: s.upper()
+uppercase = str.upper
 
-filter_evens = lambda lst: list(filter(lambda x: x % 2 == 0, lst))
+filter_evens = lambda lst: [x for x in lst if not x & 1]
 
-sum_of_list = lambda lst: sum(lst)
+sum_of_list = sum
 
-cube = lambda x: x ** 3
+cube = lambda x: x * x * x
 
-is_palindrome = lambda s: s == s[::-1]
+def is_palindrome(s):
+    n = len(s)
+    if n <= 64:
+        return s == s[::-1]
+    # Long strings: reject on the outer characters, then mirror only half the string
+    h = n >> 1
+    return s[0] == s[-1] and s[:h] == s[n - h:][::-1]
 
 multiply = lambda x, y: x * y
 
-max_in_list = lambda lst: max(lst)
+max_in_list = max
 
-min_in_list = lambda lst: min(lst)
+min_in_list = min
 
-absolute_value = lambda x: abs(x)
+absolute_value = abs
 
 power = lambda base, exp: base ** exp
 
-length = lambda s: len(s)
+length = len
 
-capitalize_first = lambda s: s[0].upper() + s[1:] if s else ""
+capitalize_first = lambda s: s[:1].upper() + s[1:]
 
 if __name__ == "__main__":
     print("Square of 5:", square(5))
@@ -1,7 +1,15 @@
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def create_squares_traditional():
-    squares = []
+    # Preallocated so the loop fills slots instead of growing the list
+    squares = [0] * 10
     for i in range(10):
-        squares.append(i * i)
+        squares[i] = i * i
     return squares
 
 def create_squares_comprehension():
@@ -17,16 +25,26 @@ def convert_to_comprehension(numbers):
     return [x * x for x in numbers]
 
 def filter_even_squares(numbers):
-    return [x * x for x in numbers if x % 2 == 0]
+    return [x * x for x in numbers if not x & 1]
 
 def create_multiplication_table(n):
     return [[i * j for j in range(1, n + 1)] for i in range(1, n + 1)]
 
+def _require_numpy(name):
+    if np is None:
+        raise ImportError(f"NumPy is required for {name}. Run: pip install numpy")
+
+def create_multiplication_table_np(n):
+    # Same table as one contiguous (n, n) int64 array built by a vectorized outer product
+    _require_numpy("create_multiplication_table_np")
+    r = np.arange(1, n + 1, dtype=np.int64)
+    return np.multiply.outer(r, r)
+
 def flatten_nested_list(nested_list):
-    return [item for sublist in nested_list for item in sublist]
+    return list(chain.from_iterable(nested_list))
 
 def create_dict_comprehension(keys, values):
-    return {k: v for k, v in zip(keys, values)}
+    return dict(zip(keys, values))
 
 def filter_strings_by_length(strings, min_length):
     return [s for s in strings if len(s) >= min_length]
@@ -35,7 +53,24 @@ def create_set_comprehension(numbers):
     return {x * x for x in numbers}
 
 def conditional_transformation(numbers):
-    return [x * 2 if x % 2 == 0 else x * 3 for x in numbers]
+    return [x * 3 if x & 1 else x * 2 for x in numbers]
+
+# Array variants of the numeric helpers: each is a few whole-array ufunc calls instead of a per-element loop
+def convert_to_comprehension_np(numbers):
+    _require_numpy("convert_to_comprehension_np")
+    a = np.asarray(numbers)
+    return a * a
+
+def filter_even_squares_np(numbers):
+    _require_numpy("filter_even_squares_np")
+    a = np.asarray(numbers)
+    evens = a[a % 2 == 0]
+    return evens * evens
+
+def conditional_transformation_np(numbers):
+    _require_numpy("conditional_transformation_np")
+    a = np.asarray(numbers)
+    return a * np.where(a % 2 == 0, 2, 3)
 
 def main():
     print("Traditional for loop:")
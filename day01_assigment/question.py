@@ -1,12 +1,35 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_C2F = 9 / 5
+_F2K = 5 / 9
+
 def celsius_to_fahrenheit(celsius):
-    return (celsius * 9/5) + 32
+    return celsius * _C2F + 32.0
 
 def fahrenheit_to_kelvin(fahrenheit):
-    return (fahrenheit - 32) * 5/9 + 273.15
+    return (fahrenheit - 32.0) * _F2K + 273.15
 
 def kelvin_to_celsius(kelvin):
     return kelvin - 273.15
 
+def _as_float_array(values):
+    if np is None:
+        raise ImportError("NumPy is required for array conversions. Run: pip install numpy")
+    return np.asarray(values, dtype=float)
+
+# Bulk variants: the scalar formulas applied to a whole array in one vectorized pass
+def celsius_to_fahrenheit_array(celsius):
+    return celsius_to_fahrenheit(_as_float_array(celsius))
+
+def fahrenheit_to_kelvin_array(fahrenheit):
+    return fahrenheit_to_kelvin(_as_float_array(fahrenheit))
+
+def kelvin_to_celsius_array(kelvin):
+    return kelvin_to_celsius(_as_float_array(kelvin))
+
 def main():
     try:
         c_val = 0
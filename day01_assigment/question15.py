@@ -1,5 +1,15 @@
+import sys
+
 library = []
 
+def _write_books(books):
+    # One write for the whole listing instead of a print per book
+    sys.stdout.write('\n'.join(
+        f"{i}. Book: {book['title']} | Author: {book['author']}"
+        for i, book in enumerate(books, 1)
+    ))
+    sys.stdout.write('\n')
+
 def add_book():
     try:
         title = input("Enter book title: ").strip()
@@ -9,9 +19,12 @@ def add_book():
             print("Error: Title and author cannot be empty!")
             return
         
+        # Lowercased copies are kept so searches don't re-lower every book
         book = {
             'title': title,
-            'author': author
+            'author': author,
+            '_title_l': title.lower(),
+            '_author_l': author.lower()
         }
         
         library.append(book)
@@ -34,14 +47,12 @@ def search_book():
         
         found_books = []
         for book in library:
-            if (search_term in book['title'].lower() or 
-                search_term in book['author'].lower()):
+            if search_term in book['_title_l'] or search_term in book['_author_l']:
                 found_books.append(book)
         
         if found_books:
             print(f"\n📚 Found {len(found_books)} book(s):")
-            for i, book in enumerate(found_books, 1):
-                print(f"{i}. Book: {book['title']} | Author: {book['author']}")
+            _write_books(found_books)
         else:
             print("No books found matching your search.")
             
@@ -56,8 +67,7 @@ def display_inventory():
     try:
         print(f"\n📚 Library Inventory ({len(library)} books):")
         print("-" * 50)
-        for i, book in enumerate(library, 1):
-            print(f"{i}. Book: {book['title']} | Author: {book['author']}")
+        _write_books(library)
         print("-" * 50)
         
     except Exception as e: